@@ -163,7 +163,7 @@ async def upload_csv(
         else:
             # Use shared utility to prepare data for existing table
             _, insert_columns, column_mapping, has_auto_generated_id = prepare_dataframe_for_import(
-                df, table_name
+                df, table_name, detect_types=False
             )
         
         # Generate INSERT statements using shared utility
@@ -227,7 +227,7 @@ async def import_csv_with_sql(
             raise HTTPException(status_code=400, detail=f"Failed to create table: {result['error']}")
         
         # Use shared utility to prepare data for import
-        _, insert_columns, _, _ = prepare_dataframe_for_import(df, table_name)
+        _, insert_columns, _, _ = prepare_dataframe_for_import(df, table_name, detect_types=False)
         
         # Generate INSERT statements using shared utility
         insert_statements = generate_insert_sql(df, table_name, insert_columns)
@@ -339,7 +339,7 @@ async def upload_csv_batch(
             else:
                 # Use shared utility to prepare data for existing table
                 _, insert_columns, column_mapping, has_auto_generated_id = prepare_dataframe_for_import(
-                    df, table_name
+                    df, table_name, detect_types=False
                 )
             
             # Generate INSERT statements using shared utility
@@ -430,7 +430,7 @@ async def import_csv_with_config(
             raise HTTPException(status_code=400, detail=f"Failed to create table: {result['error']}")
         
         # Use shared utility to prepare data for import
-        _, insert_columns, _, _ = prepare_dataframe_for_import(df, import_config.table_name)
+        _, insert_columns, _, _ = prepare_dataframe_for_import(df, import_config.table_name, detect_types=False)
         
         # Generate INSERT statements using shared utility
         insert_statements = generate_insert_sql(df, import_config.table_name, insert_columns)
@@ -270,9 +270,9 @@ async def get_quarantine_data(
 ):
     """Get quarantined dirty data"""
     try:
-        quarantine_data = data_quality_manager.get_quarantine_data(quarantine_id)
-        
         if quarantine_id:
+            # Only a single entry needs its stored rows decoded
+            quarantine_data = data_quality_manager.get_quarantine_data(quarantine_id)
             if not quarantine_data:
                 raise HTTPException(status_code=404, detail="Quarantine data not found")
             return {
@@ -286,12 +286,12 @@ async def get_quarantine_data(
                         "quarantine_id": qid,
                         "timestamp": data["timestamp"],
                         "dataset_id": data["dataset_id"],
-                        "dirty_records_count": len(data["data"]),
+                        "dirty_records_count": data["row_count"],
                         "issues_count": len(data["issues"])
                     }
-                    for qid, data in quarantine_data.items()
+                    for qid, data in data_quality_manager.quarantine_data.items()
                 ],
-                "total_entries": len(quarantine_data)
+                "total_entries": len(data_quality_manager.quarantine_data)
             }
     except HTTPException:
         raise
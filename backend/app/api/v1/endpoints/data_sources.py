@@ -77,6 +77,7 @@ class ExtractionJobCreate(BaseModel):
 class ConnectionTestRequest(BaseModel):
     type: DataSourceType
     connection_config: Dict[str, Any]
+    include_stats: bool = False
 
 
 class DataPreviewRequest(BaseModel):
@@ -86,6 +87,18 @@ class DataPreviewRequest(BaseModel):
     limit: int = 100
 
 
+class TableListRequest(BaseModel):
+    type: DataSourceType
+    connection_config: Dict[str, Any]
+    include_row_counts: bool = False
+
+
+class TableDescribeRequest(BaseModel):
+    type: DataSourceType
+    connection_config: Dict[str, Any]
+    source_name: str
+
+
 class RealTimeSyncRequest(BaseModel):
     data_source_id: int
     source_name: str
@@ -156,7 +169,8 @@ async def test_data_source_connection(request: ConnectionTestRequest) -> Dict[st
     try:
         result = await extraction_manager.test_connection(
             request.type.value,
-            request.connection_config
+            request.connection_config,
+            include_stats=request.include_stats
         )
         return result
     except Exception as e:
@@ -176,6 +190,32 @@ async def get_data_source_schema(request: ConnectionTestRequest) -> List[Dict[st
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/schema/tables")
+async def list_data_source_tables(request: TableListRequest) -> List[Dict[str, Any]]:
+    """List tables from data source without column metadata"""
+    try:
+        return await extraction_manager.list_tables(
+            request.type.value,
+            request.connection_config,
+            request.include_row_counts
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/schema/describe")
+async def describe_data_source_table(request: TableDescribeRequest) -> Dict[str, Any]:
+    """Get column metadata for a single table, loaded when it is expanded"""
+    try:
+        return await extraction_manager.describe_table(
+            request.type.value,
+            request.connection_config,
+            request.source_name
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/preview")
 async def preview_data_source(request: DataPreviewRequest) -> Dict[str, Any]:
     """Get preview of data from source"""
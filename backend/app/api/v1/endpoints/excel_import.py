@@ -1,10 +1,9 @@
 from typing import Any, Optional, Dict
 from fastapi import APIRouter, File, UploadFile, HTTPException, Form
 import pandas as pd
-import io
 import json
 
-from app.services.excel_importer import get_excel_sheets
+from app.services.excel_importer import PREVIEW_SAMPLE_ROWS, get_excel_sheets, open_excel_file, read_sheet_sample
 from app.services.type_detection import detect_column_type
 from app.services.file_validation_service import validate_excel_file
 from app.services.column_utils import build_column_preview_info, generate_table_name_from_filename
@@ -50,7 +49,7 @@ async def import_single_sheet(
     else:
         # Use shared utility to prepare data for existing table
         _, insert_columns, column_mapping, has_auto_generated_id = prepare_dataframe_for_import(
-            df, table_name
+            df, table_name, detect_types=False
         )
     
     # Generate INSERT statements using shared utility
@@ -77,8 +76,7 @@ async def get_sheets(
     """Get list of sheets in Excel file"""
     validate_excel_file(file)
     
-    contents = await file.read()
-    sheets = get_excel_sheets(io.BytesIO(contents))
+    sheets = get_excel_sheets(file.file)
     
     return {
         "filename": file.filename,
@@ -95,22 +93,19 @@ async def preview_excel(
     """Preview Excel file contents"""
     validate_excel_file(file)
     
-    contents = await file.read()
-    
-    # Read Excel file
-    excel_file = pd.ExcelFile(io.BytesIO(contents))
-    
-    # Get sheet names
-    sheet_names = excel_file.sheet_names
-    
-    # If sheet_name not specified, use first sheet
-    if not sheet_name:
-        sheet_name = sheet_names[0]
-    elif sheet_name not in sheet_names:
-        raise HTTPException(status_code=400, detail=f"Sheet '{sheet_name}' not found in Excel file")
-    
-    # Read the specified sheet
-    df = pd.read_excel(io.BytesIO(contents), sheet_name=sheet_name)
+    # Open the workbook once for both sheet listing and parsing
+    with open_excel_file(file.file) as excel_file:
+        # Get sheet names
+        sheet_names = excel_file.sheet_names
+        
+        # If sheet_name not specified, use first sheet
+        if not sheet_name:
+            sheet_name = sheet_names[0]
+        elif sheet_name not in sheet_names:
+            raise HTTPException(status_code=400, detail=f"Sheet '{sheet_name}' not found in Excel file")
+        
+        # Parse a bounded sample of the sheet from the already opened workbook
+        df, row_count = read_sheet_sample(excel_file, sheet_name, max(rows, PREVIEW_SAMPLE_ROWS))
     
     # Get sample data
     sample_data = df.head(rows).to_dict('records')
@@ -138,7 +133,9 @@ async def preview_excel(
         "sheet_name": sheet_name,
         "available_sheets": sheet_names,
         "table_name": table_name,
-        "row_count": len(df),
+        "row_count": row_count,
+        # Column stats cover only these rows when fewer than row_count
+        "sampled_rows": len(df),
         "columns": columns_info,
         "sample_data": sample_data,
         "create_table_sql": create_table_sql,
@@ -167,10 +164,8 @@ async def upload_excel(
     # Validate file
     validate_excel_file(file)
     
-    contents = await file.read()
-    
-    # Read Excel file
-    excel_file = pd.ExcelFile(io.BytesIO(contents))
+    # Open the workbook once; every imported sheet is parsed from it
+    excel_file = open_excel_file(file.file)
     sheet_names = excel_file.sheet_names
     
     # Create executor
@@ -186,7 +181,7 @@ async def upload_excel(
             # Import all sheets
             for sheet in sheet_names:
                 result = await import_single_sheet(
-                    executor, io.BytesIO(contents), sheet, 
+                    executor, excel_file, sheet, 
                     table_name or f"{generate_table_name_from_filename(file.filename)}_{sheet}",
                     create_table, detect_types
                 )
@@ -202,7 +197,7 @@ async def upload_excel(
             target_table = table_name or generate_table_name_from_filename(f"{file.filename}_{target_sheet}")
             
             result = await import_single_sheet(
-                executor, io.BytesIO(contents), target_sheet,
+                executor, excel_file, target_sheet,
                 target_table, create_table, detect_types
             )
             
@@ -225,6 +220,8 @@ async def upload_excel(
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        excel_file.close()
 
 
 @router.post("/excel/import-with-sql")
@@ -245,13 +242,9 @@ async def import_excel_with_sql(
     # Validate file
     validate_excel_file(file)
     
-    contents = await file.read()
-    
-    # Read Excel file
-    if sheet_name:
-        df = pd.read_excel(io.BytesIO(contents), sheet_name=sheet_name)
-    else:
-        df = pd.read_excel(io.BytesIO(contents))
+    # Read Excel file straight from the uploaded file
+    with open_excel_file(file.file) as excel_file:
+        df = excel_file.parse(sheet_name=sheet_name or 0)
     
     # Apply column mapping if provided
     if column_mapping:
@@ -271,7 +264,7 @@ async def import_excel_with_sql(
             raise HTTPException(status_code=400, detail=f"Failed to create table: {result['error']}")
         
         # Use shared utility to prepare data for import
-        _, insert_columns, _, _ = prepare_dataframe_for_import(df, table_name)
+        _, insert_columns, _, _ = prepare_dataframe_for_import(df, table_name, detect_types=False)
         
         # Generate INSERT statements using shared utility
         insert_statements = generate_insert_sql(df, table_name, insert_columns)
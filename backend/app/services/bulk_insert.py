@@ -0,0 +1,117 @@
+"""
+Bulk loading of DataFrames, or streams of DataFrame chunks, into existing database tables.
+PostgreSQL gets COPY FROM STDIN; other databases use pandas' multi-row INSERTs.
+"""
+import io
+import logging
+from typing import Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Rows written per COPY call or INSERT batch; bounds the size of the in-memory
+# CSV buffer and of each converted chunk
+COPY_CHUNK_ROWS = 100_000
+
+# Marker written for missing values in the COPY input
+COPY_NULL_MARKER = '\\N'
+
+
+def _quote_identifier(name) -> str:
+    """Quote a table or column name for PostgreSQL"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def bulk_insert_dataframe(
+    engine: Engine,
+    table_name: str,
+    df: pd.DataFrame,
+    convert: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+) -> None:
+    """
+    Append all rows of a DataFrame to an existing table in a single transaction
+
+    Args:
+        engine: SQLAlchemy engine of the target database
+        table_name: Existing table to append to
+        df: Rows to insert; column names must match the table's columns
+        convert: Optional type conversion applied to each chunk just before it
+            is written, so no converted copy of the whole frame is held in memory
+    """
+    bulk_insert_chunks(engine, table_name, lambda: _iter_chunks(df, convert))
+
+
+def bulk_insert_chunks(
+    engine: Engine,
+    table_name: str,
+    make_chunks: Callable[[], Iterable[pd.DataFrame]]
+) -> int:
+    """
+    Append a stream of DataFrame chunks to an existing table in a single transaction
+
+    Args:
+        engine: SQLAlchemy engine of the target database
+        table_name: Existing table to append to
+        make_chunks: Returns a fresh iterable of the chunks to insert; called a
+            second time to replay the rows if COPY rejects them
+
+    Returns:
+        Number of rows inserted
+    """
+    if engine.dialect.name == 'postgresql':
+        try:
+            return _copy_chunks(engine, table_name, make_chunks())
+        except engine.dialect.dbapi.DataError as e:
+            # COPY parses text strictly (e.g. '1.0' into an INTEGER column) where
+            # INSERT would cast; nothing was committed, so retry with INSERTs
+            logger.warning(f"COPY into {table_name} rejected the data, falling back to INSERT: {e}")
+
+    row_count = 0
+    with engine.begin() as connection:
+        for chunk in make_chunks():
+            chunk.to_sql(table_name, con=connection, if_exists='append', index=False, method='multi')
+            row_count += len(chunk)
+    return row_count
+
+
+def _iter_chunks(
+    df: pd.DataFrame,
+    convert: Optional[Callable[[pd.DataFrame], pd.DataFrame]]
+) -> Iterator[pd.DataFrame]:
+    """Yield COPY_CHUNK_ROWS-row slices of a DataFrame, converted if requested"""
+    for start in range(0, max(len(df), 1), COPY_CHUNK_ROWS):
+        chunk = df.iloc[start:start + COPY_CHUNK_ROWS]
+        yield convert(chunk) if convert is not None else chunk
+
+
+def _copy_chunks(engine: Engine, table_name: str, chunks: Iterable[pd.DataFrame]) -> int:
+    """Stream DataFrame chunks into a PostgreSQL table with COPY FROM STDIN in CSV form"""
+    row_count = 0
+    raw_connection = engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            # Column list of the chunk, since convert may rename or drop columns
+            columns = ', '.join(_quote_identifier(col) for col in chunk.columns)
+            copy_sql = (
+                f"COPY {_quote_identifier(table_name)} ({columns}) FROM STDIN "
+                f"WITH (FORMAT csv, NULL '{COPY_NULL_MARKER}')"
+            )
+            buffer = io.StringIO()
+            chunk.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL_MARKER)
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+            row_count += len(chunk)
+        cursor.close()
+        # All chunks commit together, so a failure leaves the table untouched
+        raw_connection.commit()
+    except Exception:
+        raw_connection.rollback()
+        raise
+    finally:
+        raw_connection.close()
+    return row_count
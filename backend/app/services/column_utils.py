@@ -1,7 +1,12 @@
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional, Any
 
 
+# Separators replaced by underscores in sanitized column names
+_SEPARATOR_TABLE = str.maketrans({' ': '_', '-': '_', '.': '_'})
+
+
 def sanitize_column_name(column_name: str) -> str:
     """
     Standardized column name sanitization for SQL compatibility
@@ -13,7 +18,7 @@ def sanitize_column_name(column_name: str) -> str:
         Sanitized column name safe for SQL usage
     """
     sanitized = str(column_name).strip().lower()
-    sanitized = sanitized.replace(' ', '_').replace('-', '_').replace('.', '_')
+    sanitized = sanitized.translate(_SEPARATOR_TABLE)
     sanitized = ''.join(c for c in sanitized if c.isalnum() or c == '_')
     
     # Ensure column name doesn't start with a number
@@ -27,6 +32,25 @@ def sanitize_column_name(column_name: str) -> str:
     return sanitized
 
 
+def normalize_column_labels(columns: pd.Index) -> pd.Index:
+    """
+    Lower-case all column labels at once, replacing spaces and hyphens with underscores
+    
+    Args:
+        columns: Column labels of a DataFrame
+        
+    Returns:
+        Index of normalized string labels
+    """
+    return (
+        pd.Index(columns).astype(str)
+        .str.strip()
+        .str.replace(' ', '_', regex=False)
+        .str.replace('-', '_', regex=False)
+        .str.lower()
+    )
+
+
 def generate_table_name_from_filename(filename: str, sheet_name: Optional[str] = None) -> str:
     """
     Generate table name from file and optional sheet name
@@ -78,12 +102,18 @@ def build_column_preview_info(series: pd.Series, original_name: str, sql_type: s
     """
     sanitized_name = sanitize_column_name(original_name)
     
+    # One null mask feeds the null stats and the sample values; the sample is
+    # taken by position so the non-null values are not copied out first
+    null_mask = series.isnull().to_numpy()
+    null_count = int(null_mask.sum())
+    sample_values = series.iloc[np.flatnonzero(~null_mask)[:5]].tolist()
+    
     return {
         "name": sanitized_name,
         "original_name": str(original_name),
         "suggested_type": sql_type,
-        "nullable": bool(series.isnull().any()),
-        "unique_values": int(len(series.unique())),
-        "null_count": int(series.isnull().sum()),
-        "sample_values": [str(v) for v in series.dropna().head(5).tolist()] if len(series.dropna()) > 0 else []
+        "nullable": null_count > 0,
+        "unique_values": int(series.nunique(dropna=False)),
+        "null_count": null_count,
+        "sample_values": [str(v) for v in sample_values]
     }
\ No newline at end of file
@@ -4,8 +4,9 @@ from typing import Dict, Tuple
 from fastapi import UploadFile
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from app.services.type_detection import detect_column_type
+from app.services.type_detection import detect_column_types
 from app.services.dataframe_converter import convert_dataframe_types_from_detection
+from app.services.bulk_insert import bulk_insert_dataframe
 
 
 
@@ -118,13 +119,13 @@ async def import_csv_to_table(
     type_conversions = {}
     
     if detect_types:
-        for col in df.columns:
-            sql_type, pandas_dtype = detect_column_type(df[col])
+        for col, (sql_type, pandas_dtype) in detect_column_types(df).items():
             column_types[col] = sql_type
             type_conversions[col] = pandas_dtype
         
-        # Convert DataFrame types using shared utility
-        df = convert_dataframe_types_from_detection(df, column_types)
+        # Convert DataFrame types using shared utility; the frame is only
+        # written to the table, and a float32 column would become REAL there
+        df = convert_dataframe_types_from_detection(df, column_types, compact=False)
     
     if create_table and detect_types:
         # Create table with proper types
@@ -134,7 +135,7 @@ async def import_csv_to_table(
         df = df.rename(columns=column_mapping)
         
         # Insert data
-        df.to_sql(table_name, con=db.get_bind(), if_exists='append', index=False, method='multi')
+        bulk_insert_dataframe(db.get_bind(), table_name, df)
     else:
         # Use pandas default behavior
         df.to_sql(table_name, con=db.get_bind(), if_exists='replace', index=False)
@@ -98,7 +98,8 @@ class ExtractionConfig:
         last_value: Optional[Any] = None,
         filters: Optional[Dict] = None,
         columns: Optional[List[str]] = None,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        parallelism: int = 1
     ):
         self.mode = mode
         self.chunk_size = chunk_size
@@ -107,6 +108,7 @@ class ExtractionConfig:
         self.filters = filters or {}
         self.columns = columns
         self.order_by = order_by
+        self.parallelism = parallelism
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -116,7 +118,8 @@ class ExtractionConfig:
             "last_value": self.last_value,
             "filters": self.filters,
             "columns": self.columns,
-            "order_by": self.order_by
+            "order_by": self.order_by,
+            "parallelism": self.parallelism
         }
     
     @classmethod
@@ -17,8 +17,9 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 from ..type_detection import detect_column_type
+from ..bulk_insert import bulk_insert_dataframe
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 import pandas as pd
 import logging
 
@@ -70,7 +71,12 @@ class DataExtractionManager:
         config_with_type['type'] = data_source_type
         return connector_class(config_with_type)
     
-    async def test_connection(self, data_source_type: str, connection_config: Dict[str, Any]) -> Dict[str, Any]:
+    async def test_connection(
+        self,
+        data_source_type: str,
+        connection_config: Dict[str, Any],
+        include_stats: bool = False
+    ) -> Dict[str, Any]:
         """Test connection to a data source"""
         try:
             connector = self.get_connector(data_source_type, connection_config)
@@ -84,8 +90,11 @@ class DataExtractionManager:
                     "details": validation_errors
                 }
             
-            # Test connection
-            result = await connector.test_connection()
+            # Test connection (only relational connectors have optional, slower stats)
+            if isinstance(connector, RelationalDatabaseConnector):
+                result = await connector.test_connection(include_stats=include_stats)
+            else:
+                result = await connector.test_connection()
             await connector.disconnect()
             
             return result
@@ -112,6 +121,53 @@ class DataExtractionManager:
             logger.error(f"Failed to get schema info: {str(e)}")
             return []
     
+    async def list_tables(
+        self,
+        data_source_type: str,
+        connection_config: Dict[str, Any],
+        include_row_counts: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List tables/collections without column metadata"""
+        try:
+            connector = self.get_connector(data_source_type, connection_config)
+            await connector.connect()
+            
+            if isinstance(connector, RelationalDatabaseConnector):
+                tables = await connector.list_tables(include_row_counts)
+            else:
+                tables = [
+                    {key: value for key, value in item.items() if key != "columns"}
+                    for item in await connector.get_schema_info()
+                ]
+            await connector.disconnect()
+            
+            return tables
+            
+        except Exception as e:
+            logger.error(f"Failed to list tables: {str(e)}")
+            return []
+    
+    async def describe_table(
+        self,
+        data_source_type: str,
+        connection_config: Dict[str, Any],
+        source_name: str
+    ) -> Dict[str, Any]:
+        """Get column metadata for a single table/collection"""
+        connector = self.get_connector(data_source_type, connection_config)
+        await connector.connect()
+        
+        try:
+            if isinstance(connector, RelationalDatabaseConnector):
+                return await connector.describe_table(source_name)
+            
+            for item in await connector.get_schema_info():
+                if item.get("name") == source_name:
+                    return item
+            raise ValueError(f"Source not found: {source_name}")
+        finally:
+            await connector.disconnect()
+    
     async def extract_and_load_data(
         self,
         db: Session,
@@ -145,15 +201,18 @@ class DataExtractionManager:
             # Create table if needed
             if create_table:
                 await self._create_target_table(db, first_chunk, target_table)
+                table_exists = True
+            else:
+                table_exists = inspect(db.get_bind()).has_table(target_table)
             
             # Process first chunk
-            await self._load_chunk_to_database(db, first_chunk, target_table)
+            await self._load_chunk_to_database(db, first_chunk, target_table, table_exists)
             total_records += len(first_chunk)
             chunk_count += 1
             
-            # Process remaining chunks
+            # Process remaining chunks; the first chunk has created the table
             async for chunk_df in connector.extract_data(source_name, extraction_config):
-                await self._load_chunk_to_database(db, chunk_df, target_table)
+                await self._load_chunk_to_database(db, chunk_df, target_table, table_exists=True)
                 total_records += len(chunk_df)
                 chunk_count += 1
                 
@@ -308,8 +367,14 @@ class DataExtractionManager:
             logger.error(f"Failed to create target table: {str(e)}")
             raise
     
-    async def _load_chunk_to_database(self, db: Session, chunk_df: pd.DataFrame, table_name: str):
-        """Load a chunk of data into the database"""
+    async def _load_chunk_to_database(
+        self,
+        db: Session,
+        chunk_df: pd.DataFrame,
+        table_name: str,
+        table_exists: bool
+    ):
+        """Load a chunk of data into the database; table_exists is checked once per job by the caller"""
         try:
             # Sanitize column names
             sanitized_columns = {}
@@ -321,14 +386,19 @@ class DataExtractionManager:
             # Rename columns
             chunk_df = chunk_df.rename(columns=sanitized_columns)
             
-            # Load to database
-            chunk_df.to_sql(
-                table_name,
-                con=db.get_bind(),
-                if_exists='append',
-                index=False,
-                method='multi'
-            )
+            # Load to database; existing tables take the COPY path on PostgreSQL,
+            # while to_sql still creates the table when create_table was off
+            engine = db.get_bind()
+            if table_exists:
+                bulk_insert_dataframe(engine, table_name, chunk_df)
+            else:
+                chunk_df.to_sql(
+                    table_name,
+                    con=engine,
+                    if_exists='append',
+                    index=False,
+                    method='multi'
+                )
             
         except Exception as e:
             logger.error(f"Failed to load chunk to database: {str(e)}")
@@ -462,7 +532,7 @@ class DataExtractionManager:
                 "supports_incremental": True,
                 "supports_real_time": False,
                 "required_fields": ["bucket_name"],
-                "optional_fields": ["aws_access_key_id", "aws_secret_access_key", "region_name", "prefix", "object_key"],
+                "optional_fields": ["aws_access_key_id", "aws_secret_access_key", "region_name", "prefix", "object_key", "endpoint_url", "shallow_schema"],
                 "auth_note": "Supports IAM roles, access keys, or default credentials"
             })
         
@@ -1,42 +1,96 @@
+import asyncio
+import hashlib
+import threading
+from contextlib import asynccontextmanager
 import pandas as pd
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import create_engine, text, inspect, bindparam
+from sqlalchemy.sql.elements import TextClause
 from typing import Dict, Any, List, Optional, Iterator
 from .base_connector import DataSourceConnector, ExtractionConfig
 import logging
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
 from urllib.parse import quote_plus
 
 logger = logging.getLogger(__name__)
 
+# Per-database gates shared by all connector instances, keyed by connection string hash
+_db_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+# Filter operators, e.g. {"price": {"gt": 100}}: (quoted column, bind name) -> SQL condition
+_FILTER_OPS = {
+    "eq": lambda column, param: f"{column} = :{param}",
+    "gt": lambda column, param: f"{column} > :{param}",
+    "lt": lambda column, param: f"{column} < :{param}",
+    "gte": lambda column, param: f"{column} >= :{param}",
+    "lte": lambda column, param: f"{column} <= :{param}",
+    "in": lambda column, param: f"{column} IN :{param}",
+    "like": lambda column, param: f"{column} LIKE :{param}",
+}
+
 
 class RelationalDatabaseConnector(DataSourceConnector):
     """Connector for relational databases (MySQL, PostgreSQL, SQLite, etc.)"""
     
+    # db_type -> URL template, default driver, default port, default database
+    _URL_TEMPLATES = {
+        'mysql': ("mysql+{driver}://{auth}@{host}:{port}{database}", 'pymysql', 3306, ''),
+        # PostgreSQL requires at least a database name (default to 'postgres' for listing)
+        'postgresql': ("postgresql+{driver}://{auth}@{host}:{port}{database}", 'psycopg2', 5432, 'postgres'),
+        'mssql': ("mssql+{driver}://{auth}@{host}:{port}{database}", 'pyodbc', 1433, ''),
+        'oracle': ("oracle+{driver}://{auth}@{host}:{port}{database}", 'cx_oracle', 1521, ''),
+    }
+    
     def __init__(self, connection_config: Dict[str, Any]):
         super().__init__(connection_config)
         self.engine = None
         self.db_type = connection_config.get('type', 'postgresql')
+        self._qi = None
+        self._column_types: Dict[str, Dict[str, Any]] = {}
+        self._connect_lock = asyncio.Lock()
+        self._connect_error: Optional[str] = None
         
     async def connect(self) -> bool:
-        """Establish connection to the database"""
-        try:
-            connection_string = self._build_connection_string()
-            self.engine = create_engine(
-                connection_string,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-                echo=False
-            )
-            
-            # Test the connection
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            
-            logger.info(f"Successfully connected to {self.db_type} database")
-            return True
+        """Establish connection to the database.
+        
+        Concurrent callers share one attempt: the lock makes sure the engine is built once.
+        """
+        async with self._connect_lock:
+            if self.engine:
+                return True
             
-        except Exception as e:
-            logger.error(f"Failed to connect to database: {str(e)}")
-            return False
+            engine = None
+            try:
+                connection_string = self._build_connection_string()
+                engine = create_engine(
+                    connection_string,
+                    **self._get_engine_options()
+                )
+                
+                # Test the connection
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                
+                # Quoting the same identifiers for every chunk/count query is wasted work
+                self._qi = lru_cache(maxsize=None)(engine.dialect.identifier_preparer.quote)
+                self.engine = engine
+                self._connect_error = None
+                
+                logger.info(f"Successfully connected to {self.db_type} database")
+                return True
+                
+            except Exception as e:
+                if engine is not None:
+                    engine.dispose()
+                self._connect_error = str(e)
+                logger.error(f"Failed to connect to database: {str(e)}")
+                return False
+    
+    async def _ensure_connected(self):
+        """Connect on first use, raising the original error if the connection fails"""
+        if not self.engine and not await self.connect():
+            raise ConnectionError(self._connect_error or f"Failed to connect to {self.db_type} database")
     
     async def disconnect(self) -> bool:
         """Close database connection"""
@@ -44,42 +98,23 @@ class RelationalDatabaseConnector(DataSourceConnector):
             if self.engine:
                 self.engine.dispose()
                 self.engine = None
+            self._column_types.clear()
             return True
         except Exception as e:
             logger.error(f"Failed to disconnect: {str(e)}")
             return False
     
-    async def test_connection(self) -> Dict[str, Any]:
-        """Test connection and return database metadata"""
+    async def test_connection(self, include_stats: bool = False) -> Dict[str, Any]:
+        """Test connection and return database metadata.
+        
+        Listing tables can take seconds on large schemas, so the table count is only
+        collected when include_stats is set (e.g. an explicit refresh in the UI).
+        """
         try:
-            if not self.engine:
-                await self.connect()
-                
-            with self.engine.connect() as conn:
-                # Get database version
-                version_query = self._get_version_query()
-                result = conn.execute(text(version_query)).fetchone()
-                version = result[0] if result else "Unknown"
+            await self._ensure_connected()
                 
-                response = {
-                    "status": "success",
-                    "database_type": self.db_type,
-                    "version": version,
-                    "connection_info": self.get_connection_info()
-                }
-                
-                # If database is specified, get table count
-                if self.connection_config.get('database'):
-                    inspector = inspect(self.engine)
-                    table_names = inspector.get_table_names()
-                    response["table_count"] = len(table_names)
-                else:
-                    # If no database specified, return available databases
-                    databases = await self.get_available_databases()
-                    response["available_databases"] = databases
-                    response["database_count"] = len(databases)
-                
-                return response
+            async with self._conn() as conn:
+                return self._test_connection(conn, include_stats)
                 
         except Exception as e:
             return {
@@ -87,39 +122,128 @@ class RelationalDatabaseConnector(DataSourceConnector):
                 "error": str(e)
             }
     
+    def _test_connection(self, conn, include_stats: bool = False) -> Dict[str, Any]:
+        """Run the connection test queries on an open connection"""
+        # Get database version
+        version_query = self._get_version_query()
+        result = conn.execute(text(version_query)).fetchone()
+        version = result[0] if result else "Unknown"
+        
+        response = {
+            "status": "success",
+            "database_type": self.db_type,
+            "version": version,
+            "connection_info": self.get_connection_info()
+        }
+        
+        # If database is specified, get table count
+        if self.connection_config.get('database'):
+            if include_stats:
+                inspector = inspect(conn)
+                table_names = inspector.get_table_names()
+                response["table_count"] = len(table_names)
+        else:
+            # If no database specified, return available databases
+            databases = self._list_databases(conn)
+            response["available_databases"] = databases
+            response["database_count"] = len(databases)
+        
+        return response
+    
     async def get_schema_info(self) -> List[Dict[str, Any]]:
         """Get database schema information"""
         try:
-            if not self.engine:
-                await self.connect()
+            await self._ensure_connected()
                 
-            inspector = inspect(self.engine)
-            schema_info = []
+            async with self._conn() as conn:
+                return self._get_schema_info(conn)
             
-            for table_name in inspector.get_table_names():
-                columns = inspector.get_columns(table_name)
+        except Exception as e:
+            logger.error(f"Failed to get schema info: {str(e)}")
+            return []
+    
+    def _get_schema_info(self, conn) -> List[Dict[str, Any]]:
+        """Collect table and column metadata on an open connection"""
+        inspector = inspect(conn)
+        schema_info = []
+        
+        for table_name, columns in sorted(self._get_all_columns(inspector).items()):
+            schema_info.append({
+                "name": table_name,
+                "type": "table",
+                "columns": [
+                    {
+                        "name": col["name"],
+                        "type": str(col["type"]),
+                        "nullable": col.get("nullable", True),
+                        "primary_key": col.get("primary_key", False)
+                    }
+                    for col in columns
+                ],
+                "row_count": self._count_or_zero(conn, table_name)
+            })
+        
+        return schema_info
+    
+    async def list_tables(self, include_row_counts: bool = False) -> List[Dict[str, Any]]:
+        """List tables without column metadata, for a fast first paint of the schema tree"""
+        try:
+            await self._ensure_connected()
                 
-                schema_info.append({
-                    "name": table_name,
-                    "type": "table",
-                    "columns": [
-                        {
-                            "name": col["name"],
-                            "type": str(col["type"]),
-                            "nullable": col.get("nullable", True),
-                            "primary_key": col.get("primary_key", False)
-                        }
-                        for col in columns
-                    ],
-                    "row_count": await self.get_record_count(table_name)
-                })
-            
-            return schema_info
+            async with self._conn() as conn:
+                tables = []
+                for table_name in inspect(conn).get_table_names():
+                    table = {"name": table_name, "type": "table"}
+                    if include_row_counts:
+                        table["row_count"] = self._count_or_zero(conn, table_name)
+                    tables.append(table)
+                
+                return tables
             
         except Exception as e:
-            logger.error(f"Failed to get schema info: {str(e)}")
+            logger.error(f"Failed to list tables: {str(e)}")
             return []
     
+    async def describe_table(self, source: str) -> Dict[str, Any]:
+        """Get columns, primary key and row count for a single table"""
+        await self._ensure_connected()
+            
+        schema, _, table_name = source.rpartition(".")
+        async with self._conn() as conn:
+            inspector = inspect(conn)
+            columns = inspector.get_columns(table_name, schema=schema or None)
+            pk_columns = inspector.get_pk_constraint(table_name, schema=schema or None).get("constrained_columns") or []
+            
+            return {
+                "name": source,
+                "type": "table",
+                "columns": [
+                    {
+                        "name": col["name"],
+                        "type": str(col["type"]),
+                        "nullable": col.get("nullable", True),
+                        "primary_key": col["name"] in pk_columns
+                    }
+                    for col in columns
+                ],
+                "primary_key": pk_columns,
+                "row_count": self._count_or_zero(conn, source)
+            }
+    
+    def _get_all_columns(self, inspector) -> Dict[str, List[Dict[str, Any]]]:
+        """Get column metadata for every table, in one catalog query where supported"""
+        if hasattr(inspector, "get_multi_columns"):
+            # SQLAlchemy 2.0+: keys are (schema, table_name) tuples
+            return {
+                table_name: columns
+                for (_, table_name), columns in inspector.get_multi_columns().items()
+            }
+        
+        return {
+            table_name: inspector.get_columns(table_name)
+            for table_name in inspector.get_table_names()
+        }
+    
     async def extract_data(
         self,
         source: str,
@@ -128,17 +252,21 @@ class RelationalDatabaseConnector(DataSourceConnector):
     ) -> Iterator[pd.DataFrame]:
         """Extract data from database table"""
         try:
-            if not self.engine:
-                await self.connect()
+            await self._ensure_connected()
                 
             config = ExtractionConfig.from_dict(extraction_config)
             chunk_size = chunk_size or config.chunk_size
             
+            if config.parallelism > 1 and self._is_partitionable(source, config.incremental_column):
+                async for chunk_df in self._extract_partitioned(source, config, chunk_size):
+                    yield chunk_df
+                return
+            
             # Build the query
             query = self._build_extraction_query(source, config)
             
             # Execute query in chunks
-            with self.engine.connect() as conn:
+            async with self._conn() as conn:
                 for chunk_df in pd.read_sql(
                     query,
                     conn,
@@ -150,26 +278,180 @@ class RelationalDatabaseConnector(DataSourceConnector):
             logger.error(f"Failed to extract data from {source}: {str(e)}")
             raise
     
+    def _is_partitionable(self, source: str, column: Optional[str]) -> bool:
+        """Check whether a column can be split into equi-width ranges"""
+        if not column:
+            return False
+        
+        col_type = self._get_column_types(source).get(column)
+        try:
+            return col_type is not None and col_type.python_type in (int, datetime, date)
+        except NotImplementedError:
+            return False
+    
+    async def _extract_partitioned(
+        self,
+        source: str,
+        config: ExtractionConfig,
+        chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a table as K range partitions read concurrently on separate connections.
+        
+        Chunks arrive in completion order, so ORDER BY only holds within a partition.
+        """
+        ranges = self._get_partition_ranges(source, config)
+        if not ranges:
+            return
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=len(ranges) * 2)
+        stop = threading.Event()
+        done = object()
+        
+        async def produce(query: TextClause):
+            try:
+                async with self._gate():
+                    await loop.run_in_executor(
+                        None, self._read_partition, query, chunk_size, queue, loop, stop
+                    )
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                await queue.put(done)
+        
+        column = self._quote_identifier(config.incremental_column)
+        producers = []
+        for i, (lo, hi) in enumerate(ranges):
+            upper = "<=" if i == len(ranges) - 1 else "<"
+            query = self._build_extraction_query(
+                source,
+                config,
+                extra_conditions=[f"{column} >= :part_lo", f"{column} {upper} :part_hi"],
+                extra_params=[bindparam("part_lo", lo), bindparam("part_hi", hi)]
+            )
+            producers.append(asyncio.create_task(produce(query)))
+        
+        try:
+            remaining = len(producers)
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Unblock producers if the consumer stopped early
+            stop.set()
+            while not all(task.done() for task in producers):
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.sleep(0.01)
+    
+    def _get_partition_ranges(self, source: str, config: ExtractionConfig) -> List[tuple]:
+        """Split [MIN, MAX] of the incremental column into equi-width ranges"""
+        column = self._quote_identifier(config.incremental_column)
+        conditions, bind_params = self._build_where_conditions(source, config)
+        
+        query = f"SELECT MIN({column}), MAX({column}) FROM {self._quote_identifier(source)}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
+        with self.engine.connect() as conn:
+            lo, hi = conn.execute(text(query).bindparams(*bind_params)).fetchone()
+        
+        if lo is None or hi is None:
+            return []
+        
+        stored_lo = stored_hi = None
+        if isinstance(lo, str):
+            # Timestamps stored as text (SQLite) are compared as strings
+            stored_lo, stored_hi = lo, hi
+            lo, hi = pd.Timestamp(lo).to_pydatetime(), pd.Timestamp(hi).to_pydatetime()
+        
+        partitions = config.parallelism
+        if isinstance(lo, int):
+            partitions = max(1, min(partitions, hi - lo + 1))
+            bounds = [lo + (hi - lo) * i // partitions for i in range(partitions)] + [hi]
+        else:
+            bounds = [lo + (hi - lo) * i / partitions for i in range(partitions)] + [hi]
+        
+        if stored_lo is not None:
+            # Bind the bounds in the stored format, the outer ones exactly as
+            # stored, so no row falls outside the partitions as a string
+            bounds = (
+                [stored_lo]
+                + [self._format_like_stored(bound, stored_lo) for bound in bounds[1:-1]]
+                + [stored_hi]
+            )
+        
+        return list(zip(bounds[:-1], bounds[1:]))
+    
+    @staticmethod
+    def _format_like_stored(value: datetime, stored: str) -> str:
+        """Format a datetime like a text-stored value such as '2024-01-31 12:00:00'"""
+        if len(stored) <= 10:
+            return value.date().isoformat()
+        
+        fraction = stored[19:].partition(".")[2]
+        if not fraction:
+            timespec = "seconds"
+        elif len(fraction) <= 3:
+            timespec = "milliseconds"
+        else:
+            timespec = "microseconds"
+        return value.isoformat(sep=stored[10], timespec=timespec)
+    
+    def _read_partition(
+        self,
+        query: TextClause,
+        chunk_size: int,
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+        stop: threading.Event
+    ):
+        """Read one partition on its own pooled connection (runs in a worker thread)"""
+        with self.engine.connect() as conn:
+            for chunk_df in pd.read_sql(query, conn, chunksize=chunk_size):
+                if stop.is_set():
+                    return
+                asyncio.run_coroutine_threadsafe(queue.put(chunk_df), loop).result()
+    
     async def get_record_count(self, source: str, filters: Optional[Dict] = None) -> int:
         """Get record count for a table"""
         try:
-            if not self.engine:
-                await self.connect()
+            await self._ensure_connected()
                 
-            with self.engine.connect() as conn:
-                query = f"SELECT COUNT(*) FROM {source}"
-                if filters:
-                    where_clause = self._build_where_clause(filters)
-                    if where_clause:
-                        query += f" WHERE {where_clause}"
-                        
-                result = conn.execute(text(query)).fetchone()
-                return result[0] if result else 0
+            async with self._conn() as conn:
+                return self._count(conn, source, filters)
                 
         except Exception as e:
             logger.error(f"Failed to get record count: {str(e)}")
             return 0
     
+    def _count(self, conn, source: str, filters: Optional[Dict] = None) -> int:
+        """Count rows in a table on an open connection"""
+        query = f"SELECT COUNT(*) FROM {self._quote_identifier(source)}"
+        bind_params = []
+        if filters:
+            where_clause, bind_params = self._build_where_clause(filters)
+            if where_clause:
+                query += f" WHERE {where_clause}"
+                
+        result = conn.execute(text(query).bindparams(*bind_params)).fetchone()
+        return result[0] if result else 0
+    
+    def _count_or_zero(self, conn, source: str) -> int:
+        """Count rows for schema listings, reporting 0 for tables that can't be counted"""
+        try:
+            return self._count(conn, source)
+        except Exception as e:
+            logger.error(f"Failed to get record count: {str(e)}")
+            # Clear a failed transaction so the connection stays usable
+            conn.rollback()
+            return 0
+    
     def get_required_config_fields(self) -> List[str]:
         """Return required configuration fields"""
         if self.db_type == 'sqlite':
@@ -184,8 +466,7 @@ class RelationalDatabaseConnector(DataSourceConnector):
     async def get_incremental_key_columns(self, source: str) -> List[str]:
         """Get columns suitable for incremental extraction"""
         try:
-            if not self.engine:
-                await self.connect()
+            await self._ensure_connected()
                 
             inspector = inspect(self.engine)
             columns = inspector.get_columns(source)
@@ -208,43 +489,46 @@ class RelationalDatabaseConnector(DataSourceConnector):
     async def get_available_databases(self) -> List[str]:
         """Get list of available databases"""
         try:
-            if not self.engine:
-                await self.connect()
+            await self._ensure_connected()
                 
-            with self.engine.connect() as conn:
-                if self.db_type == 'mysql':
-                    result = conn.execute(text("SHOW DATABASES"))
-                    databases = [row[0] for row in result]
-                    # Filter out system databases
-                    return [db for db in databases if db not in ['information_schema', 'mysql', 'performance_schema', 'sys']]
-                    
-                elif self.db_type == 'postgresql':
-                    result = conn.execute(text(
-                        "SELECT datname FROM pg_database WHERE datistemplate = false"
-                    ))
-                    return [row[0] for row in result]
-                    
-                elif self.db_type == 'mssql':
-                    result = conn.execute(text(
-                        "SELECT name FROM sys.databases WHERE name NOT IN ('master', 'tempdb', 'model', 'msdb')"
-                    ))
-                    return [row[0] for row in result]
-                    
-                elif self.db_type == 'oracle':
-                    # Oracle uses schemas instead of databases
-                    result = conn.execute(text(
-                        "SELECT username FROM all_users WHERE username NOT IN "
-                        "('SYS', 'SYSTEM', 'DBSNMP', 'SYSMAN', 'OUTLN', 'FLOWS_FILES', 'MDSYS', 'ORDSYS', 'EXFSYS', 'CTXSYS', 'XDB', 'ANONYMOUS')"
-                    ))
-                    return [row[0] for row in result]
-                    
-                else:
-                    return []
+            async with self._conn() as conn:
+                return self._list_databases(conn)
                     
         except Exception as e:
             logger.error(f"Failed to get available databases: {str(e)}")
             return []
     
+    def _list_databases(self, conn) -> List[str]:
+        """List databases visible on an open connection"""
+        if self.db_type == 'mysql':
+            result = conn.execute(text("SHOW DATABASES"))
+            databases = [row[0] for row in result]
+            # Filter out system databases
+            return [db for db in databases if db not in ['information_schema', 'mysql', 'performance_schema', 'sys']]
+            
+        elif self.db_type == 'postgresql':
+            result = conn.execute(text(
+                "SELECT datname FROM pg_database WHERE datistemplate = false"
+            ))
+            return [row[0] for row in result]
+            
+        elif self.db_type == 'mssql':
+            result = conn.execute(text(
+                "SELECT name FROM sys.databases WHERE name NOT IN ('master', 'tempdb', 'model', 'msdb')"
+            ))
+            return [row[0] for row in result]
+            
+        elif self.db_type == 'oracle':
+            # Oracle uses schemas instead of databases
+            result = conn.execute(text(
+                "SELECT username FROM all_users WHERE username NOT IN "
+                "('SYS', 'SYSTEM', 'DBSNMP', 'SYSMAN', 'OUTLN', 'FLOWS_FILES', 'MDSYS', 'ORDSYS', 'EXFSYS', 'CTXSYS', 'XDB', 'ANONYMOUS')"
+            ))
+            return [row[0] for row in result]
+            
+        else:
+            return []
+    
     def _build_connection_string(self) -> str:
         """Build database connection string"""
         config = self.connection_config
@@ -252,46 +536,80 @@ class RelationalDatabaseConnector(DataSourceConnector):
         if self.db_type == 'sqlite':
             return f"sqlite:///{config['database']}"
         
+        if self.db_type not in self._URL_TEMPLATES:
+            raise ValueError(f"Unsupported database type: {self.db_type}")
+        template, default_driver, default_port, default_database = self._URL_TEMPLATES[self.db_type]
+        
         # Encode password to handle special characters
         password = quote_plus(config['password']) if config.get('password') else ''
         username = config['username']
-        host = config['host']
-        port = config.get('port', self._get_default_port())
-        database = config.get('database', '')  # Database is optional
+        database = config.get('database') or default_database  # Database is optional
         
-        # Build auth part
-        auth = f"{username}:{password}" if password else username
+        url = template.format_map({
+            "driver": config.get('driver', default_driver),
+            # Build auth part
+            "auth": f"{username}:{password}" if password else username,
+            "host": config['host'],
+            "port": config.get('port', default_port),
+            "database": f"/{database}" if database else ""
+        })
         
-        if self.db_type == 'mysql':
-            driver = config.get('driver', 'pymysql')
-            base_url = f"mysql+{driver}://{auth}@{host}:{port}"
-            return f"{base_url}/{database}" if database else base_url
-        elif self.db_type == 'postgresql':
-            driver = config.get('driver', 'psycopg2')
-            base_url = f"postgresql+{driver}://{auth}@{host}:{port}"
-            # PostgreSQL requires at least a database name (default to 'postgres' for listing)
-            return f"{base_url}/{database}" if database else f"{base_url}/postgres"
-        elif self.db_type == 'mssql':
-            driver = config.get('driver', 'pyodbc')
-            base_url = f"mssql+{driver}://{auth}@{host}:{port}"
-            url = f"{base_url}/{database}" if database else base_url
-            return f"{url}?driver=ODBC+Driver+17+for+SQL+Server"
-        elif self.db_type == 'oracle':
-            driver = config.get('driver', 'cx_oracle')
-            base_url = f"oracle+{driver}://{auth}@{host}:{port}"
-            return f"{base_url}/{database}" if database else base_url
-        else:
-            raise ValueError(f"Unsupported database type: {self.db_type}")
+        if self.db_type == 'mssql':
+            url += "?driver=ODBC+Driver+17+for+SQL+Server"
+        return url
+    
+    @asynccontextmanager
+    async def _conn(self):
+        """Hold a gate permit and one pooled connection for the duration of a public call"""
+        async with self._gate():
+            with self.engine.connect() as conn:
+                yield conn
+    
+    def _gate(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent queries against this database"""
+        key = hashlib.sha256(self._build_connection_string().encode()).hexdigest()
+        if key not in _db_semaphores:
+            _db_semaphores[key] = asyncio.Semaphore(
+                self.connection_config.get('max_concurrent_queries', 15)
+            )
+        return _db_semaphores[key]
+    
+    def _get_engine_options(self) -> Dict[str, Any]:
+        """Get create_engine options tuned for the database type"""
+        config = self.connection_config
+        options = {
+            "pool_pre_ping": True,
+            "pool_recycle": config.get('pool_recycle', 3600),
+            "echo": False
+        }
+        
+        if self.db_type == 'sqlite':
+            return options
+        
+        # Size the pool for concurrent UI requests instead of the default 5
+        options.update({
+            "pool_size": config.get('pool_size', 10),
+            "max_overflow": config.get('max_overflow', 10),
+            "pool_timeout": config.get('pool_timeout', 30)
+        })
+        
+        if self.db_type == 'postgresql':
+            statement_timeout = config.get('statement_timeout', 60000)
+            options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+            if config.get('driver', 'psycopg2') == 'psycopg2':
+                options["executemany_mode"] = "values_plus_batch"
+                options["insertmanyvalues_page_size"] = 10000
+        elif self.db_type == 'mysql':
+            # Recycle below the server's wait_timeout so pooled connections don't go stale
+            options["pool_recycle"] = config.get('pool_recycle', 280)
+        
+        return options
     
     def _get_default_port(self) -> int:
         """Get default port for database type"""
-        ports = {
-            'mysql': 3306,
-            'postgresql': 5432,
-            'mssql': 1433,
-            'oracle': 1521
-        }
-        return ports.get(self.db_type, 5432)
+        if self.db_type in self._URL_TEMPLATES:
+            return self._URL_TEMPLATES[self.db_type][2]
+        return 5432
     
     def _get_version_query(self) -> str:
         """Get version query for different database types"""
@@ -304,60 +622,131 @@ class RelationalDatabaseConnector(DataSourceConnector):
         }
         return queries.get(self.db_type, "SELECT 'Unknown' as version")
     
-    def _build_extraction_query(self, source: str, config: ExtractionConfig) -> str:
+    def _build_extraction_query(
+        self,
+        source: str,
+        config: ExtractionConfig,
+        extra_conditions: Optional[List[str]] = None,
+        extra_params: Optional[List[Any]] = None
+    ) -> TextClause:
         """Build SQL query for data extraction"""
         # Select columns
         if config.columns:
-            columns_str = ", ".join(config.columns)
+            columns_str = ", ".join(self._quote_identifier(col) for col in config.columns)
         else:
             columns_str = "*"
             
-        query = f"SELECT {columns_str} FROM {source}"
+        query = f"SELECT {columns_str} FROM {self._quote_identifier(source)}"
         
         # Add WHERE clause for filters and incremental extraction
+        where_conditions, bind_params = self._build_where_conditions(source, config)
+        where_conditions += extra_conditions or []
+        bind_params += extra_params or []
+        
+        if where_conditions:
+            query += " WHERE " + " AND ".join(where_conditions)
+        
+        # Add ORDER BY
+        if config.order_by:
+            query += f" ORDER BY {self._quote_order_by(config.order_by)}"
+        elif config.incremental_column:
+            query += f" ORDER BY {self._quote_identifier(config.incremental_column)}"
+            
+        return text(query).bindparams(*bind_params)
+    
+    def _build_where_conditions(self, source: str, config: ExtractionConfig) -> tuple:
+        """Build WHERE conditions and their bind parameters for filters and incremental mode"""
         where_conditions = []
+        bind_params = []
         
         if config.filters:
-            filter_clause = self._build_where_clause(config.filters)
+            filter_clause, bind_params = self._build_where_clause(config.filters)
             if filter_clause:
                 where_conditions.append(filter_clause)
         
         if config.mode == "incremental" and config.incremental_column and config.last_value:
-            where_conditions.append(f"{config.incremental_column} > '{config.last_value}'")
+            # Bind with the column's own type so the comparison can use an index
+            col_type = self._get_column_types(source).get(config.incremental_column)
+            last_value = self._coerce_bind_value(config.last_value, col_type)
+            bind_params.append(bindparam("last_val", last_value, type_=col_type))
+            
+            incremental_column = self._quote_identifier(config.incremental_column)
+            where_conditions.append(f"{incremental_column} > :last_val")
         
-        if where_conditions:
-            query += " WHERE " + " AND ".join(where_conditions)
+        return where_conditions, bind_params
+    
+    def _get_column_types(self, source: str) -> Dict[str, Any]:
+        """Get a cached column name -> SQLAlchemy type map for a table"""
+        if source not in self._column_types:
+            schema, _, table_name = source.rpartition(".")
+            columns = inspect(self.engine).get_columns(table_name, schema=schema or None)
+            self._column_types[source] = {col["name"]: col["type"] for col in columns}
         
-        # Add ORDER BY
-        if config.order_by:
-            query += f" ORDER BY {config.order_by}"
-        elif config.incremental_column:
-            query += f" ORDER BY {config.incremental_column}"
-            
-        return query
+        return self._column_types[source]
+    
+    def _coerce_bind_value(self, value: Any, col_type: Any) -> Any:
+        """Convert a value (often a string from the job config) to the column's Python type"""
+        if col_type is None:
+            return value
+        
+        try:
+            python_type = col_type.python_type
+        except NotImplementedError:
+            return value
+        
+        try:
+            if python_type is datetime:
+                return pd.Timestamp(value).to_pydatetime()
+            if python_type is date:
+                return pd.Timestamp(value).date()
+            if python_type in (int, float, Decimal):
+                return python_type(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Could not convert {value!r} to {python_type.__name__}, binding as-is")
+        
+        return value
     
-    def _build_where_clause(self, filters: Dict[str, Any]) -> str:
-        """Build WHERE clause from filters"""
+    def _build_where_clause(self, filters: Dict[str, Any]) -> tuple:
+        """Build WHERE clause and its bind parameters from filters"""
         conditions = []
+        bind_params = []
         
         for column, value in filters.items():
-            if isinstance(value, dict):
-                # Handle operators like {"gt": 100}, {"in": [1,2,3]}
-                for op, val in value.items():
-                    if op == "gt":
-                        conditions.append(f"{column} > '{val}'")
-                    elif op == "lt":
-                        conditions.append(f"{column} < '{val}'")
-                    elif op == "gte":
-                        conditions.append(f"{column} >= '{val}'")
-                    elif op == "lte":
-                        conditions.append(f"{column} <= '{val}'")
-                    elif op == "in" and isinstance(val, list):
-                        val_str = "', '".join(str(v) for v in val)
-                        conditions.append(f"{column} IN ('{val_str}')")
-                    elif op == "like":
-                        conditions.append(f"{column} LIKE '{val}'")
-            else:
-                conditions.append(f"{column} = '{value}'")
+            column = self._quote_identifier(column)
+            # Handle operators like {"gt": 100}, {"in": [1,2,3]}; plain values mean equality
+            operators = value if isinstance(value, dict) else {"eq": value}
+            
+            for op, val in operators.items():
+                if op not in _FILTER_OPS or (op == "in" and not isinstance(val, list)):
+                    continue
+                
+                param = f"filter_{len(bind_params)}"
+                conditions.append(_FILTER_OPS[op](column, param))
+                bind_params.append(bindparam(param, val, expanding=(op == "in")))
                 
-        return " AND ".join(conditions)
\ No newline at end of file
+        return " AND ".join(conditions), bind_params
+    
+    def _quote_identifier(self, name: str) -> str:
+        """Validate and quote a (possibly schema-qualified) identifier for the current dialect"""
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Invalid identifier: {name!r}")
+        
+        return ".".join(self._qi(part.strip()) for part in name.split("."))
+    
+    def _quote_order_by(self, order_by: str) -> str:
+        """Quote an ORDER BY list such as "created_at DESC, id" """
+        items = []
+        for item in order_by.split(","):
+            tokens = item.split()
+            if not tokens or len(tokens) > 2:
+                raise ValueError(f"Invalid ORDER BY expression: {item.strip()!r}")
+            
+            quoted = self._quote_identifier(tokens[0])
+            if len(tokens) == 2:
+                direction = tokens[1].upper()
+                if direction not in ("ASC", "DESC"):
+                    raise ValueError(f"Invalid ORDER BY direction: {tokens[1]!r}")
+                quoted = f"{quoted} {direction}"
+            items.append(quoted)
+        
+        return ", ".join(items)
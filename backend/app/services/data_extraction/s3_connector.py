@@ -1,7 +1,15 @@
+import asyncio
+import hashlib
+import numpy as np
 import pandas as pd
 import boto3
 import io
-from typing import Dict, Any, List, Optional, Iterator
+import itertools
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Iterator, Tuple
 from .base_connector import DataSourceConnector, ExtractionConfig
 import logging
 from botocore.exceptions import ClientError, NoCredentialsError
@@ -11,14 +19,109 @@ logger = logging.getLogger(__name__)
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError, NoCredentialsError
     BOTO3_AVAILABLE = True
 except ImportError:
     BOTO3_AVAILABLE = False
     boto3 = None
+    Config = None
     ClientError = Exception
     NoCredentialsError = Exception
 
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pa_ds
+    import pyarrow.fs as pa_fs
+    import pyarrow.json as pa_json
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pa_ds = None
+    pa_fs = None
+    pa_json = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# orjson parses bytes directly; the stdlib parser is the fallback
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+PARQUET_EXTENSIONS = ('.parquet', '.pqt')
+
+# Clients are thread-safe and costly to build, so connectors with the same
+# credentials and endpoint share one
+_s3_clients: Dict[str, Any] = {}
+
+# A connector is built per request, so listings, row counts and parsed objects
+# are shared at module level, scoped by endpoint, bucket and credentials
+_list_cache: Dict[Tuple[str, str, bool], Tuple[float, List[Dict[str, Any]]]] = {}
+_rowcount_cache: OrderedDict = OrderedDict()
+# Latest known ETag per object and when it was seen, taken from listings and
+# downloads; entries expire with the listing TTL so rewritten objects are refetched
+_known_etags: OrderedDict = OrderedDict()
+_content_cache: OrderedDict = OrderedDict()
+_content_cache_bytes = 0
+_cache_lock = threading.Lock()
+
+# SQL types by numpy dtype kind; anything else is stored as TEXT
+_KIND_TO_SQL = {
+    'i': 'INTEGER',
+    'u': 'INTEGER',
+    'f': 'REAL',
+    'b': 'BOOLEAN',
+    'M': 'TIMESTAMP',
+    'O': 'TEXT',
+    'U': 'TEXT',
+    'S': 'TEXT',
+}
+
+# Filter operators, matching the relational connector's {"gt": 100} / {"in": [...]} format
+_MASK_OPS = {
+    'eq': lambda series, value: series == value,
+    'gt': lambda series, value: series > value,
+    'lt': lambda series, value: series < value,
+    'gte': lambda series, value: series >= value,
+    'lte': lambda series, value: series <= value,
+    'in': lambda series, value: series.isin(value),
+}
+
+# Storage classes whose objects must be restored before they can be read
+ARCHIVED_STORAGE_CLASSES = ('GLACIER', 'DEEP_ARCHIVE')
+
+# Delimited and line-oriented formats that can be parsed incrementally
+STREAMABLE_SEPARATORS = {'csv': ',', 'tsv': '\t', 'jsonl': None}
+STREAM_THRESHOLD_BYTES = 64 << 20
+JSON_BLOCK_SIZE = 8 << 20
+
+# Parsed small objects kept for repeated previews/extractions, evicted LRU by size
+CONTENT_CACHE_MAX_BYTES = 256 << 20
+
+# Formats whose previews can be parsed from a leading byte range
+RANGED_PREVIEW_EXTENSIONS = ('csv', 'tsv', 'jsonl', 'txt')
+
+# Object listings are reused across schema, preview and extract calls
+LIST_CACHE_TTL_SECONDS = 60
+LIST_CACHE_MAX_ENTRIES = 64
+
+# Filtered row counts and listing ETags remembered, evicted LRU by count
+ROWCOUNT_CACHE_MAX_ENTRIES = 4096
+KNOWN_ETAGS_MAX_ENTRIES = 65536
+
+# Input serializations for formats S3 Select can filter server-side
+S3_SELECT_INPUTS = {
+    'csv': {'CSV': {'FileHeaderInfo': 'USE'}},
+    'tsv': {'CSV': {'FileHeaderInfo': 'USE', 'FieldDelimiter': '\t'}},
+    'jsonl': {'JSON': {'Type': 'LINES'}},
+}
+S3_SELECT_UNSUPPORTED_ERRORS = ('MethodNotAllowed', 'NotImplemented', 'AccessDenied')
+_SELECT_OPERATORS = {'eq': '=', 'gt': '>', 'lt': '<', 'gte': '>=', 'lte': '<='}
+
 
 class S3Connector(DataSourceConnector):
     """Connector for Amazon S3 data sources"""
@@ -30,25 +133,14 @@ class S3Connector(DataSourceConnector):
         super().__init__(connection_config)
         self.s3_client = None
         self.bucket_name = None
+        self._pa_fs = None
+        self._s3_select_enabled = connection_config.get('use_s3_select', True)
+        self._cache_scope = self._get_cache_scope()
         
     async def connect(self) -> bool:
         """Test connection to S3."""
         try:
-            # Initialize S3 client with credentials
-            aws_access_key_id = self.connection_config.get('aws_access_key_id')
-            aws_secret_access_key = self.connection_config.get('aws_secret_access_key')
-            region_name = self.connection_config.get('region_name', 'us-east-1')
-            
-            if aws_access_key_id and aws_secret_access_key:
-                self.s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=aws_access_key_id,
-                    aws_secret_access_key=aws_secret_access_key,
-                    region_name=region_name
-                )
-            else:
-                # Try to use default credentials (IAM role, env vars, etc.)
-                self.s3_client = boto3.client('s3', region_name=region_name)
+            self.s3_client = self._get_client()
             
             self.bucket_name = self.connection_config.get('bucket_name')
             if not self.bucket_name:
@@ -56,7 +148,7 @@ class S3Connector(DataSourceConnector):
                 return False
             
             # Test connection by listing bucket (with limit)
-            self.s3_client.list_objects_v2(Bucket=self.bucket_name, MaxKeys=1)
+            await asyncio.to_thread(self.s3_client.list_objects_v2, Bucket=self.bucket_name, MaxKeys=1)
             
             logger.info(f"Successfully connected to S3 bucket: {self.bucket_name}")
             return True
@@ -74,6 +166,7 @@ class S3Connector(DataSourceConnector):
     async def disconnect(self) -> bool:
         """Clean up S3 connection"""
         self.s3_client = None
+        self._pa_fs = None
         return True
     
     async def test_connection(self) -> Dict[str, Any]:
@@ -87,7 +180,8 @@ class S3Connector(DataSourceConnector):
             
             # Get bucket info
             try:
-                response = self.s3_client.list_objects_v2(
+                response = await asyncio.to_thread(
+                    self.s3_client.list_objects_v2,
                     Bucket=self.bucket_name,
                     MaxKeys=1000
                 )
@@ -97,7 +191,9 @@ class S3Connector(DataSourceConnector):
                 
                 # Get bucket location
                 try:
-                    location = self.s3_client.get_bucket_location(Bucket=self.bucket_name)
+                    location = await asyncio.to_thread(
+                        self.s3_client.get_bucket_location, Bucket=self.bucket_name
+                    )
                     region = location.get('LocationConstraint') or 'us-east-1'
                 except:
                     region = 'unknown'
@@ -124,44 +220,54 @@ class S3Connector(DataSourceConnector):
                 "error": str(e)
             }
     
-    async def get_schema_info(self) -> List[Dict[str, Any]]:
-        """Get available S3 objects/prefixes."""
+    async def get_schema_info(self, deep: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Get available S3 objects/prefixes.
+        
+        A deep scan lists every object under the prefix and groups them by
+        extension. A shallow scan lists a single level with Delimiter='/'
+        and reports sub-prefixes instead of enumerating their contents.
+        """
         try:
             if not self.s3_client:
                 await self.connect()
             
+            if deep is None:
+                deep = not self.connection_config.get('shallow_schema', False)
+            
             schema_info = []
             prefix = self.connection_config.get('prefix', '')
             
-            # List objects with the specified prefix
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+            if deep:
+                objects = await self._list_objects(prefix, self.connection_config.get('schema_max_keys'))
+            else:
+                objects = []
+                async for page in self._paginate(Prefix=prefix, Delimiter='/'):
+                    objects.extend(page.get('Contents', []))
+                    for common_prefix in page.get('CommonPrefixes', []):
+                        schema_info.append({
+                            'name': common_prefix['Prefix'],
+                            'type': 's3_prefix',
+                            'row_count': None,  # Not listed in a shallow scan
+                            'column_count': 1,
+                            'description': f"Prefix {common_prefix['Prefix']}"
+                        })
             
-            file_types = {}
+            file_types = defaultdict(lambda: {
+                'count': 0,
+                'total_size': 0,
+                'sample_files': []
+            })
             
-            for page in page_iterator:
-                for obj in page.get('Contents', []):
-                    key = obj['Key']
-                    size = obj['Size']
-                    
-                    # Group by file extension
-                    if '.' in key:
-                        ext = key.split('.')[-1].lower()
-                    else:
-                        ext = 'no_extension'
-                    
-                    if ext not in file_types:
-                        file_types[ext] = {
-                            'count': 0,
-                            'total_size': 0,
-                            'sample_files': []
-                        }
-                    
-                    file_types[ext]['count'] += 1
-                    file_types[ext]['total_size'] += size
-                    
-                    if len(file_types[ext]['sample_files']) < 5:
-                        file_types[ext]['sample_files'].append(key)
+            # Group objects by file extension
+            for obj in objects:
+                key = obj['Key']
+                
+                info = file_types[self._ext_of(key) or 'no_extension']
+                info['count'] += 1
+                info['total_size'] += obj['Size']
+                
+                if len(info['sample_files']) < 5:
+                    info['sample_files'].append(key)
             
             # Create schema info for each file type
             for ext, info in file_types.items():
@@ -190,13 +296,8 @@ class S3Connector(DataSourceConnector):
             
             if not object_key:
                 # If no specific object, list some objects
-                response = self.s3_client.list_objects_v2(
-                    Bucket=self.bucket_name,
-                    MaxKeys=limit
-                )
-                
                 objects_data = []
-                for obj in response.get('Contents', []):
+                for obj in await self._list_objects('', max_keys=limit):
                     objects_data.append({
                         'key': obj['Key'],
                         'size': obj['Size'],
@@ -218,11 +319,7 @@ class S3Connector(DataSourceConnector):
             
             # Try to read and preview specific object content
             try:
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=object_key)
-                content = response['Body'].read()
-                
-                # Try to determine file type and parse accordingly
-                df = self._parse_s3_object_content(object_key, content, limit)
+                df = await asyncio.to_thread(self._load_preview_frame, object_key, limit)
                 
                 if df.empty:
                     return {
@@ -234,12 +331,7 @@ class S3Connector(DataSourceConnector):
                     }
                 
                 # Get column information
-                columns_info = []
-                for col in df.columns:
-                    columns_info.append({
-                        'name': col,
-                        'sql_type': self._infer_sql_type(df[col])
-                    })
+                columns_info = self._infer_sql_types(df)
                 
                 return {
                     'status': 'success',
@@ -282,45 +374,124 @@ class S3Connector(DataSourceConnector):
             chunk_size = chunk_size or config.chunk_size
             
             # Get list of objects to process
-            objects_to_process = await self._get_objects_list(source)
+            objects_to_process = await self._list_objects_to_extract(source, config)
+            etags = {obj['Key']: obj['ETag'] for obj in objects_to_process}
+            stream_threshold = self.connection_config.get('stream_threshold_bytes', STREAM_THRESHOLD_BYTES)
             
-            for obj_key in objects_to_process:
+            # Parquet objects stream through pyarrow, which already range-reads in parallel
+            text_keys = []
+            streamed_keys = []
+            for obj in objects_to_process:
+                obj_key = obj['Key']
+                if not self._is_parquet_key(obj_key):
+                    if obj['Size'] >= stream_threshold and self._ext_of(obj_key) in STREAMABLE_SEPARATORS:
+                        streamed_keys.append(obj_key)
+                    else:
+                        text_keys.append(obj_key)
+                    continue
+                
                 try:
-                    # Read object content
-                    response = self.s3_client.get_object(Bucket=self.bucket_name, Key=obj_key)
-                    content = response['Body'].read()
-                    
-                    # Parse content based on file type
-                    df = self._parse_s3_object_content(obj_key, content)
-                    
-                    if df.empty:
-                        continue
-                    
-                    # Apply filters if specified
-                    if config.filters:
-                        df = self._apply_filters(df, config.filters)
-                    
-                    # Select specific columns if specified
-                    if config.columns:
-                        available_columns = [col for col in config.columns if col in df.columns]
-                        if available_columns:
-                            df = df[available_columns]
-                    
-                    # Yield data in chunks
-                    for i in range(0, len(df), chunk_size):
-                        chunk = df.iloc[i:i + chunk_size].copy()
-                        # Add metadata about source object
-                        chunk['_s3_source_key'] = obj_key
+                    # Column projection and filters are pushed down into the Parquet reader
+                    batches = self._iter_parquet_object(
+                        obj_key, config.columns, config.filters, batch_size=chunk_size
+                    )
+                    row_count = 0
+                    while (chunk := await asyncio.to_thread(next, batches, None)) is not None:
+                        row_count += len(chunk)
+                        chunk = chunk.assign(_s3_source_key=obj_key)
                         yield chunk
-                        
+                    self._remember_rowcount(self._rowcount_key(obj_key, etags[obj_key], config.filters), row_count)
                 except Exception as e:
                     logger.error(f"Failed to process S3 object {obj_key}: {str(e)}")
-                    continue
+            
+            # Large text objects are parsed as their bytes arrive instead of being held in memory
+            for obj_key in streamed_keys:
+                try:
+                    frames = self._iter_streamed_object(obj_key, config.filters, config.columns, chunk_size)
+                    row_count = 0
+                    while (chunk := await asyncio.to_thread(next, frames, None)) is not None:
+                        row_count += len(chunk)
+                        chunk = chunk.assign(_s3_source_key=obj_key)
+                        yield chunk
+                    self._remember_rowcount(self._rowcount_key(obj_key, etags[obj_key], config.filters), row_count)
+                except Exception as e:
+                    logger.error(f"Failed to process S3 object {obj_key}: {str(e)}")
+            
+            # Other objects are downloaded and parsed concurrently
+            async for obj_key, df in self._iter_fetched_objects(text_keys, config.filters, config.columns):
+                # Remember the filtered row count so get_record_count need not re-read
+                self._remember_rowcount(self._rowcount_key(obj_key, etags[obj_key], config.filters), len(df))
+                # Add metadata about source object once, then yield slices without copying
+                df = df.assign(_s3_source_key=obj_key)
+                for i in range(0, len(df), chunk_size):
+                    yield df.iloc[i:i + chunk_size]
             
         except Exception as e:
             logger.error(f"Failed to extract S3 data: {str(e)}")
             raise
     
+    async def _list_objects_to_extract(self, source: str, config: ExtractionConfig) -> List[Dict[str, Any]]:
+        """List the readable objects an extraction should process.
+        
+        Incremental runs keyed on the object key resume the listing server-side
+        with StartAfter (keys are listed in lexicographic order); runs keyed on
+        LastModified can only filter the listing client-side.
+        """
+        prefix = self._resolve_prefix(source)
+        if config.mode != 'incremental' or config.last_value is None:
+            objects = await self._list_objects(prefix)
+        elif config.incremental_column in ('Key', '_s3_source_key'):
+            objects = await self._list_objects(prefix, start_after=str(config.last_value))
+        elif config.incremental_column in ('LastModified', '_s3_last_modified'):
+            watermark = pd.Timestamp(config.last_value)
+            if watermark.tzinfo is None:
+                watermark = watermark.tz_localize('UTC')
+            objects = [obj for obj in await self._list_objects(prefix) if obj['LastModified'] > watermark]
+        else:
+            objects = await self._list_objects(prefix)
+        
+        return await self._skip_archived_objects(objects)
+    
+    async def _skip_archived_objects(self, objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop archived objects, whose GETs would fail, optionally requesting their restore"""
+        readable = []
+        for obj in objects:
+            if obj['StorageClass'] not in ARCHIVED_STORAGE_CLASSES or self._is_restored(obj):
+                readable.append(obj)
+                continue
+            
+            if self.connection_config.get('restore_archived_objects'):
+                await self._request_restore(obj)
+            else:
+                logger.warning(f"Skipping archived S3 object {obj['Key']} ({obj['StorageClass']})")
+        return readable
+    
+    @staticmethod
+    def _is_restored(obj: Dict[str, Any]) -> bool:
+        restore_status = obj.get('RestoreStatus') or {}
+        return bool(restore_status.get('RestoreExpiryDate')) and not restore_status.get('IsRestoreInProgress')
+    
+    async def _request_restore(self, obj: Dict[str, Any]) -> None:
+        """Start restoring an archived object so a later extraction can read it"""
+        if (obj.get('RestoreStatus') or {}).get('IsRestoreInProgress'):
+            logger.info(f"Skipping S3 object {obj['Key']}, restore in progress")
+            return
+        
+        try:
+            await asyncio.to_thread(
+                self.s3_client.restore_object,
+                Bucket=self.bucket_name,
+                Key=obj['Key'],
+                RestoreRequest={
+                    'Days': self.connection_config.get('restore_days', 1),
+                    'GlacierJobParameters': {'Tier': self.connection_config.get('restore_tier', 'Standard')}
+                }
+            )
+            logger.info(f"Requested restore of archived S3 object {obj['Key']}")
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'RestoreAlreadyInProgress':
+                logger.error(f"Failed to restore S3 object {obj['Key']}: {str(e)}")
+    
     async def supports_incremental_extraction(self) -> bool:
         """S3 objects can support incremental extraction based on LastModified."""
         return True
@@ -330,28 +501,44 @@ class S3Connector(DataSourceConnector):
         return False
     
     async def get_incremental_key_columns(self, source: str) -> List[str]:
-        """S3 objects can use LastModified for incremental extraction."""
-        return ['LastModified', '_s3_last_modified']
+        """S3 objects can use LastModified or their key for incremental extraction."""
+        return ['LastModified', '_s3_last_modified', '_s3_source_key']
     
     async def get_record_count(self, source: str, filters: Optional[Dict] = None) -> int:
         """Get record count - for S3 this could be object count or total records in objects."""
         try:
-            objects_list = await self._get_objects_list(source)
+            if not self.s3_client:
+                await self.connect()
+            
+            objects_list = await self._list_objects(self._resolve_prefix(source))
             
             if not filters:
                 return len(objects_list)
             
-            # For filtered count, would need to read all objects (expensive)
+            # Filtered counts need the rows; reuse counts from earlier reads of
+            # the same object version and count Parquet from its metadata
             total_count = 0
-            for obj_key in objects_list:
-                try:
-                    response = self.s3_client.get_object(Bucket=self.bucket_name, Key=obj_key)
-                    content = response['Body'].read()
-                    df = self._parse_s3_object_content(obj_key, content)
-                    df = self._apply_filters(df, filters)
-                    total_count += len(df)
-                except Exception:
-                    continue
+            pending = {}
+            for obj in objects_list:
+                cache_key = self._rowcount_key(obj['Key'], obj['ETag'], filters)
+                cached_count = self._get_cached_rowcount(cache_key)
+                if cached_count is not None:
+                    total_count += cached_count
+                elif self._is_parquet_key(obj['Key']):
+                    try:
+                        count = await asyncio.to_thread(self._count_parquet_rows, obj['Key'], filters)
+                    except Exception as e:
+                        logger.error(f"Failed to count rows in S3 object {obj['Key']}: {str(e)}")
+                        continue
+                    self._remember_rowcount(cache_key, count)
+                    total_count += count
+                else:
+                    pending[obj['Key']] = cache_key
+            
+            # For other formats, would need to read the objects (expensive)
+            async for obj_key, df in self._iter_fetched_objects(list(pending), filters):
+                self._remember_rowcount(pending[obj_key], len(df))
+                total_count += len(df)
             
             return total_count
             
@@ -363,68 +550,624 @@ class S3Connector(DataSourceConnector):
         """Return required configuration fields for S3"""
         return ['bucket_name']
     
-    async def _get_objects_list(self, pattern: str) -> List[str]:
-        """Get list of S3 objects matching pattern"""
-        objects = []
+    def _resolve_prefix(self, pattern: str) -> str:
+        """Combine the configured prefix with a source pattern"""
         prefix = self.connection_config.get('prefix', '')
         
         if pattern and pattern != prefix:
             # Use pattern as additional prefix
-            full_prefix = f"{prefix}{pattern}" if prefix else pattern
-        else:
-            full_prefix = prefix
+            return f"{prefix}{pattern}" if prefix else pattern
+        return prefix
+    
+    def _get_cache_scope(self) -> str:
+        """Identify the bucket, endpoint and credentials the shared caches are kept for"""
+        return hashlib.sha256(json.dumps([
+            self.connection_config.get('aws_access_key_id'),
+            self.connection_config.get('aws_secret_access_key'),
+            self.connection_config.get('region_name', 'us-east-1'),
+            self.connection_config.get('endpoint_url'),
+            self.connection_config.get('bucket_name')
+        ]).encode()).hexdigest()
+    
+    def _rowcount_key(self, object_key: str, etag: Optional[str], filters: Optional[Dict[str, Any]]) -> Tuple[str, str, str, str]:
+        """Cache key for a filtered row count of one object version"""
+        return (self._cache_scope, object_key, etag or '', json.dumps(filters or {}, sort_keys=True, default=str))
+    
+    @staticmethod
+    def _get_cached_rowcount(cache_key: Tuple[str, str, str, str]) -> Optional[int]:
+        """Return a remembered filtered row count, if any"""
+        with _cache_lock:
+            count = _rowcount_cache.get(cache_key)
+            if count is not None:
+                _rowcount_cache.move_to_end(cache_key)
+            return count
+    
+    @staticmethod
+    def _remember_rowcount(cache_key: Tuple[str, str, str, str], count: int) -> None:
+        """Store a filtered row count, evicting the least recently used ones over the cap"""
+        with _cache_lock:
+            _rowcount_cache[cache_key] = count
+            _rowcount_cache.move_to_end(cache_key)
+            while len(_rowcount_cache) > ROWCOUNT_CACHE_MAX_ENTRIES:
+                _rowcount_cache.popitem(last=False)
+    
+    async def _list_objects(
+        self,
+        prefix: str,
+        max_keys: Optional[int] = None,
+        start_after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List object metadata under a prefix, served from a short-lived cache.
         
-        paginator = self.s3_client.get_paginator('list_objects_v2')
-        page_iterator = paginator.paginate(Bucket=self.bucket_name, Prefix=full_prefix)
+        Bounded or resumed (start_after) listings are not cached; up to 1000
+        keys they take a single ListObjectsV2 request instead of a paginator.
+        """
+        if start_after is None:
+            objects = self._get_cached_listing(prefix)
+            if objects is not None:
+                return objects[:max_keys] if max_keys else objects
+        
+        list_kwargs = {'Prefix': prefix}
+        if self.connection_config.get('restore_archived_objects'):
+            # Lets restored archive objects be told apart from unreadable ones
+            list_kwargs['OptionalObjectAttributes'] = ['RestoreStatus']
+        if start_after is not None:
+            list_kwargs['StartAfter'] = start_after
         
-        for page in page_iterator:
-            for obj in page.get('Contents', []):
-                objects.append(obj['Key'])
+        if max_keys and max_keys <= 1000:
+            response = await asyncio.to_thread(
+                self.s3_client.list_objects_v2,
+                Bucket=self.bucket_name,
+                MaxKeys=max_keys,
+                **list_kwargs
+            )
+            return [self._object_metadata(obj) for obj in response.get('Contents', [])]
         
+        objects = []
+        if max_keys:
+            list_kwargs['PaginationConfig'] = {'MaxItems': max_keys}
+        async for page in self._paginate(**list_kwargs):
+            objects.extend(self._object_metadata(obj) for obj in page.get('Contents', []))
+        
+        if max_keys or start_after is not None:
+            return objects
+        
+        with _cache_lock:
+            if len(_list_cache) >= LIST_CACHE_MAX_ENTRIES:
+                # Evict the oldest listing
+                oldest = min(_list_cache, key=lambda k: _list_cache[k][0])
+                del _list_cache[oldest]
+            _list_cache[self._list_cache_key(prefix)] = (time.monotonic(), objects)
+            
+            listed_at = time.monotonic()
+            for obj in objects:
+                self._remember_etag(obj['Key'], obj['ETag'], listed_at)
         return objects
     
-    def _parse_s3_object_content(self, object_key: str, content: bytes, limit: Optional[int] = None) -> pd.DataFrame:
-        """Parse S3 object content based on file extension"""
+    def _remember_etag(self, object_key: str, etag: Optional[str], seen_at: float) -> None:
+        """Record an object's current ETag; the caller holds _cache_lock"""
+        etag_key = (self._cache_scope, object_key)
+        _known_etags[etag_key] = (etag, seen_at)
+        _known_etags.move_to_end(etag_key)
+        while len(_known_etags) > KNOWN_ETAGS_MAX_ENTRIES:
+            _known_etags.popitem(last=False)
+    
+    @staticmethod
+    def _object_metadata(obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the listing fields the connector uses"""
+        return {
+            'Key': obj['Key'],
+            'Size': obj['Size'],
+            'LastModified': obj['LastModified'],
+            'ETag': obj.get('ETag'),
+            'StorageClass': obj.get('StorageClass', 'STANDARD'),
+            'RestoreStatus': obj.get('RestoreStatus')
+        }
+    
+    def _get_cached_listing(self, prefix: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached listing for the prefix if it has not expired"""
+        cache_key = self._list_cache_key(prefix)
+        with _cache_lock:
+            entry = _list_cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            listed_at, objects = entry
+            ttl = self.connection_config.get('list_cache_ttl', LIST_CACHE_TTL_SECONDS)
+            if time.monotonic() - listed_at > ttl:
+                del _list_cache[cache_key]
+                return None
+            return objects
+    
+    def _list_cache_key(self, prefix: str) -> Tuple[str, str, bool]:
+        """Cache key for a listing; restore status is only listed on request"""
+        return (self._cache_scope, prefix, bool(self.connection_config.get('restore_archived_objects')))
+    
+    async def _paginate(self, **kwargs):
+        """Yield ListObjectsV2 pages, fetching each one off the event loop"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = iter(paginator.paginate(Bucket=self.bucket_name, **kwargs))
+        
+        while (page := await asyncio.to_thread(next, pages, None)) is not None:
+            yield page
+    
+    def _get_client(self):
+        """Get a shared S3 client for this connector's credentials and endpoint"""
+        aws_access_key_id = self.connection_config.get('aws_access_key_id')
+        aws_secret_access_key = self.connection_config.get('aws_secret_access_key')
+        region_name = self.connection_config.get('region_name', 'us-east-1')
+        # Optional endpoint for S3-compatible stores (MinIO, LocalStack, ...)
+        endpoint_url = self.connection_config.get('endpoint_url')
+        
+        client_config = Config(
+            # Room for every in-flight GET of the object thread pool
+            max_pool_connections=max(64, self._get_max_workers() * 2),
+            retries={
+                'max_attempts': self.connection_config.get('max_attempts', 10),
+                'mode': 'adaptive'
+            },
+            tcp_keepalive=True,
+            connect_timeout=self.connection_config.get('connect_timeout', 3),
+            read_timeout=self.connection_config.get('read_timeout', 30)
+        )
+        
+        key = hashlib.sha256(json.dumps(
+            [aws_access_key_id, aws_secret_access_key, region_name, endpoint_url,
+             client_config.max_pool_connections, client_config.retries,
+             client_config.connect_timeout, client_config.read_timeout]
+        ).encode()).hexdigest()
+        if key in _s3_clients:
+            return _s3_clients[key]
+        
+        if aws_access_key_id and aws_secret_access_key:
+            client = boto3.client(
+                's3',
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=client_config
+            )
+        else:
+            # Try to use default credentials (IAM role, env vars, etc.)
+            client = boto3.client(
+                's3',
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=client_config
+            )
+        
+        _s3_clients[key] = client
+        return client
+    
+    def _get_max_workers(self) -> int:
+        """Number of objects fetched concurrently"""
+        return self.connection_config.get('max_workers', 16)
+    
+    async def _iter_fetched_objects(
+        self,
+        object_keys: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ):
+        """Fetch and parse objects on a bounded thread pool, yielding (key, DataFrame) as they complete"""
+        max_workers = self._get_max_workers()
+        keys = iter(object_keys)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+        def submit(key):
+            return asyncio.wrap_future(executor.submit(self._fetch_and_parse, key, filters, columns))
+        
         try:
-            # Determine file type from key
-            if '.' in object_key:
-                ext = object_key.split('.')[-1].lower()
-            else:
-                ext = 'txt'
-            
-            # Convert bytes to string for text formats
-            if ext in ['csv', 'tsv', 'txt', 'json', 'jsonl']:
-                content_str = content.decode('utf-8')
-            
-            if ext == 'csv':
-                df = pd.read_csv(io.StringIO(content_str))
-            elif ext == 'tsv':
-                df = pd.read_csv(io.StringIO(content_str), sep='\t')
-            elif ext == 'json':
-                data = json.loads(content_str)
-                if isinstance(data, list):
-                    df = pd.json_normalize(data)
-                else:
-                    df = pd.json_normalize([data])
-            elif ext == 'jsonl':
-                # JSON Lines format
-                lines = content_str.strip().split('\n')
-                data = [json.loads(line) for line in lines if line.strip()]
-                df = pd.json_normalize(data)
-            elif ext in ['parquet', 'pqt']:
-                # For parquet files in S3
+            # Keep at most 2x max_workers objects in flight so memory stays bounded
+            in_flight = {submit(key): key for key in itertools.islice(keys, max_workers * 2)}
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    obj_key = in_flight.pop(future)
+                    next_key = next(keys, None)
+                    if next_key is not None:
+                        in_flight[submit(next_key)] = next_key
+                    
+                    try:
+                        df = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process S3 object {obj_key}: {str(e)}")
+                        continue
+                    
+                    if not df.empty:
+                        yield obj_key, df
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _load_preview_frame(self, object_key: str, limit: int) -> pd.DataFrame:
+        """Read the first rows of one object for a preview"""
+        if self._is_parquet_key(object_key):
+            # Only the footer and the first row group(s) are fetched
+            batches = list(self._iter_parquet_object(object_key, batch_size=limit, limit=limit))
+            return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+        
+        cached = self._get_cached_frame(object_key)
+        if cached is not None:
+            return cached.head(limit)
+        
+        if (self._ext_of(object_key) or 'txt') not in RANGED_PREVIEW_EXTENSIONS:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=object_key)
+            content = response['Body'].read()
+            
+            # Try to determine file type and parse accordingly
+            return self._parse_s3_object_content(object_key, content, limit)
+        
+        # Line-oriented formats only need the leading bytes; widen the range
+        # until enough complete rows arrive or the whole object has been read
+        prefetch = max(256 * 1024, limit * 2048)
+        while True:
+            content, complete = self._get_object_head(object_key, prefetch)
+            if not complete:
+                # Drop the trailing partial line
+                content = content[:content.rfind(b'\n') + 1]
+            
+            df = self._parse_s3_object_content(object_key, content, limit)
+            if complete or len(df) >= limit:
+                return df
+            prefetch *= 4
+    
+    def _get_object_head(self, object_key: str, num_bytes: int) -> Tuple[bytes, bool]:
+        """Fetch the first bytes of an object; also report whether that was all of it"""
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=object_key, Range=f'bytes=0-{num_bytes - 1}'
+            )
+        except ClientError as e:
+            # Empty objects cannot satisfy any range
+            if e.response.get('Error', {}).get('Code') == 'InvalidRange':
+                return b'', True
+            raise
+        
+        content = response['Body'].read()
+        # ContentRange looks like "bytes 0-1023/52341"; absent when the whole object was sent
+        total = response.get('ContentRange', '').rpartition('/')[2]
+        complete = not total.isdigit() or int(total) <= len(content)
+        return content, complete
+    
+    def _fetch_and_parse(
+        self,
+        object_key: str,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Download and parse one object, then apply filters and column selection"""
+        if self._is_parquet_key(object_key):
+            chunks = list(self._iter_parquet_object(object_key, columns, filters))
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        
+        cached = self._get_cached_frame(object_key)
+        if cached is None:
+            if (filters or columns) and self._s3_select_enabled:
                 try:
-                    import pyarrow.parquet as pq
-                    table = pq.read_table(io.BytesIO(content))
-                    df = table.to_pandas()
-                except ImportError:
-                    logger.error("PyArrow required for Parquet files")
-                    return pd.DataFrame()
+                    df = self._select_object(object_key, filters, columns)
+                    if df is not None:
+                        return df
+                except ClientError as e:
+                    code = e.response.get('Error', {}).get('Code')
+                    if code in S3_SELECT_UNSUPPORTED_ERRORS:
+                        self._s3_select_enabled = False
+                    logger.warning(f"S3 Select failed for {object_key}, downloading full object: {str(e)}")
+                except Exception as e:
+                    logger.warning(f"S3 Select failed for {object_key}, downloading full object: {str(e)}")
+            
+            # Read object content
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=object_key)
+            content = response['Body'].read()
+            
+            # Parse content based on file type
+            # Filter columns must be parsed even when they are not selected
+            usecols = list(columns) + [col for col in (filters or {}) if col not in columns] if columns else None
+            df = self._parse_s3_object_content(object_key, content, usecols=usecols)
+            
+            # Only complete parses are reusable by other callers
+            if usecols is None and not df.empty:
+                self._cache_frame(object_key, response.get('ETag'), df)
+                cached = df
+        else:
+            df = cached
+        
+        if df.empty:
+            return df
+        
+        # Apply filters if specified
+        if filters:
+            df = self._apply_filters(df, filters)
+        
+        df = self._select_columns(df, columns)
+        # Callers add columns to the result, so never hand out the cached frame itself
+        return df.copy(deep=False) if df is cached else df
+    
+    def _get_cached_frame(self, object_key: str) -> Optional[pd.DataFrame]:
+        """Look up a parsed object by the ETag last seen in a listing or download"""
+        ttl = self.connection_config.get('list_cache_ttl', LIST_CACHE_TTL_SECONDS)
+        with _cache_lock:
+            known = _known_etags.get((self._cache_scope, object_key))
+            if known is None:
+                return None
+            
+            etag, seen_at = known
+            if time.monotonic() - seen_at > ttl:
+                # The object may have been rewritten since; fetch it again
+                del _known_etags[(self._cache_scope, object_key)]
+                return None
+            
+            cache_key = (self._cache_scope, object_key, etag)
+            entry = _content_cache.get(cache_key)
+            if entry is None:
+                return None
+            _content_cache.move_to_end(cache_key)
+            return entry[0]
+    
+    def _cache_frame(self, object_key: str, etag: Optional[str], df: pd.DataFrame) -> None:
+        """Store a parsed object, evicting the least recently used ones over the size cap"""
+        if not etag:
+            return
+        
+        max_bytes = self.connection_config.get('content_cache_bytes', CONTENT_CACHE_MAX_BYTES)
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > max_bytes:
+            return
+        
+        global _content_cache_bytes
+        cache_key = (self._cache_scope, object_key, etag)
+        with _cache_lock:
+            previous = _content_cache.pop(cache_key, None)
+            if previous is not None:
+                _content_cache_bytes -= previous[1]
+            
+            while _content_cache and _content_cache_bytes + size > max_bytes:
+                _, (_, evicted_size) = _content_cache.popitem(last=False)
+                _content_cache_bytes -= evicted_size
+            
+            _content_cache[cache_key] = (df, size)
+            _content_cache_bytes += size
+            # The download just returned this ETag, so it is current
+            self._remember_etag(object_key, etag, time.monotonic())
+    
+    def _select_columns(self, df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Select specific columns if specified, ignoring ones the frame lacks"""
+        if columns:
+            available_columns = [col for col in columns if col in df.columns]
+            if available_columns:
+                df = df[available_columns]
+        return df
+    
+    def _iter_streamed_object(
+        self,
+        object_key: str,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        chunk_size: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """Parse a CSV/TSV/JSON Lines object chunk by chunk from the response stream"""
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=object_key)
+        body = response['Body']
+        try:
+            sep = STREAMABLE_SEPARATORS[self._ext_of(object_key)]
+            if sep is None:
+                lines = body.iter_lines(chunk_size=JSON_BLOCK_SIZE)
+                frames = (
+                    self._read_json_lines(b'\n'.join(batch))
+                    for batch in iter(lambda: list(itertools.islice(lines, chunk_size)), [])
+                )
             else:
-                # Fallback: treat as text file
-                lines = content_str.split('\n')
-                df = pd.DataFrame([{'line_number': i+1, 'content': line} 
-                                  for i, line in enumerate(lines) if line.strip()])
+                frames = pd.read_csv(body, sep=sep, chunksize=chunk_size)
+            
+            for df in frames:
+                if filters:
+                    df = self._apply_filters(df, filters)
+                if not df.empty:
+                    yield self._select_columns(df, columns)
+        finally:
+            body.close()
+    
+    @staticmethod
+    def _ext_of(object_key: str) -> str:
+        """Lower-cased text after the last dot of a key, or '' when there is none"""
+        _, dot, ext = object_key.rpartition('.')
+        return ext.lower() if dot else ''
+    
+    def _select_object(
+        self,
+        object_key: str,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Filter and project an object server-side with S3 Select.
+        
+        Returns None when the object or filters cannot be expressed as an
+        S3 Select query, so the caller falls back to a full download.
+        """
+        input_serialization = S3_SELECT_INPUTS.get(self._ext_of(object_key))
+        if input_serialization is None:
+            return None
+        is_csv = 'CSV' in input_serialization
+        
+        header = None
+        if is_csv:
+            header = self._read_csv_header(object_key, input_serialization['CSV'].get('FieldDelimiter', ','))
+            if header is None:
+                return None
+            # Filters and columns on unknown fields are ignored, as in the local path
+            filters = {col: value for col, value in (filters or {}).items() if col in header}
+            columns = [col for col in (columns or []) if col in header]
+        
+        conditions = []
+        for column, op, value in self._iter_filter_predicates(filters):
+            condition = self._select_condition(column, op, value, is_csv)
+            if condition is None:
+                return None
+            conditions.append(condition)
+        
+        # Only CSV projection is pushed down; JSON keys are not known up front
+        projection = columns if is_csv and columns else None
+        select_list = ', '.join(f's.{self._select_identifier(col)}' for col in projection) if projection else '*'
+        expression = f"SELECT {select_list} FROM s3object s"
+        if conditions:
+            expression += ' WHERE ' + ' AND '.join(conditions)
+        
+        response = self.s3_client.select_object_content(
+            Bucket=self.bucket_name,
+            Key=object_key,
+            ExpressionType='SQL',
+            Expression=expression,
+            InputSerialization=input_serialization,
+            OutputSerialization={'CSV': {}} if is_csv else {'JSON': {'RecordDelimiter': '\n'}}
+        )
+        payload = b''.join(
+            event['Records']['Payload'] for event in response['Payload'] if 'Records' in event
+        )
+        
+        if is_csv:
+            names = projection or header
+            if not payload.strip():
+                return pd.DataFrame(columns=names)
+            return pd.read_csv(io.BytesIO(payload), header=None, names=names)
+        
+        df = self._read_json_lines(payload)
+        if columns and not df.empty:
+            available_columns = [col for col in columns if col in df.columns]
+            if available_columns:
+                df = df[available_columns]
+        return df
+    
+    def _read_csv_header(self, object_key: str, delimiter: str, max_bytes: int = 65536) -> Optional[List[str]]:
+        """Read the header row of a delimited object with a ranged GET"""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name, Key=object_key, Range=f'bytes=0-{max_bytes - 1}'
+        )
+        head = response['Body'].read()
+        if b'\n' not in head and len(head) >= max_bytes:
+            return None
+        first_line = head.split(b'\n', 1)[0].decode('utf-8')
+        return list(pd.read_csv(io.StringIO(first_line), sep=delimiter, nrows=0).columns)
+    
+    @staticmethod
+    def _select_identifier(column: str) -> str:
+        return '"' + str(column).replace('"', '""') + '"'
+    
+    def _select_condition(self, column: str, op: str, value: Any, is_csv: bool) -> Optional[str]:
+        """Render a filter predicate as an S3 Select condition, or None if unsupported"""
+        values = value if op == 'in' else [value]
+        if not values:
+            return None
+        if all(isinstance(v, str) for v in values):
+            literals = ["'" + v.replace("'", "''") + "'" for v in values]
+            field = f's.{self._select_identifier(column)}'
+        elif all(isinstance(v, (int, float)) and not isinstance(v, bool) and v == v for v in values):
+            literals = [repr(v) for v in values]
+            field = f's.{self._select_identifier(column)}'
+            if is_csv:
+                # CSV fields are always strings server-side
+                field = f"CAST({field} AS FLOAT)"
+        else:
+            return None
+        
+        if op == 'in':
+            return f"{field} IN ({', '.join(literals)})"
+        return f"{field} {_SELECT_OPERATORS[op]} {literals[0]}"
+    
+    def _is_parquet_key(self, object_key: str) -> bool:
+        """Check whether an object can be streamed with the pyarrow Parquet reader"""
+        return PYARROW_AVAILABLE and object_key.lower().endswith(PARQUET_EXTENSIONS)
+    
+    def _get_pa_fs(self):
+        """Lazily create a pyarrow S3 filesystem using this connector's credentials"""
+        if self._pa_fs is None:
+            options = {'region': self.connection_config.get('region_name', 'us-east-1')}
+            
+            aws_access_key_id = self.connection_config.get('aws_access_key_id')
+            aws_secret_access_key = self.connection_config.get('aws_secret_access_key')
+            if aws_access_key_id and aws_secret_access_key:
+                options['access_key'] = aws_access_key_id
+                options['secret_key'] = aws_secret_access_key
+            
+            endpoint_url = self.connection_config.get('endpoint_url')
+            if endpoint_url:
+                scheme, _, host = endpoint_url.rpartition('://')
+                options['endpoint_override'] = host
+                options['scheme'] = scheme or 'https'
+            
+            self._pa_fs = pa_fs.S3FileSystem(**options)
+        return self._pa_fs
+    
+    def _open_parquet_dataset(self, object_key: str):
+        return pa_ds.dataset(
+            f"{self.bucket_name}/{object_key}",
+            filesystem=self._get_pa_fs(),
+            format='parquet'
+        )
+    
+    def _parquet_filter_expression(self, dataset, filters: Optional[Dict[str, Any]]):
+        """Build a filter expression, ignoring columns the file lacks"""
+        schema_names = set(dataset.schema.names)
+        expression = None
+        for column, op, value in self._iter_filter_predicates(filters):
+            if column in schema_names:
+                field = pa_ds.field(column)
+                condition = field.isin(value) if op == 'in' else _MASK_OPS[op](field, value)
+                expression = condition if expression is None else expression & condition
+        return expression
+    
+    def _count_parquet_rows(self, object_key: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count rows in a Parquet object; without filters only the footer is read"""
+        dataset = self._open_parquet_dataset(object_key)
+        return dataset.count_rows(filter=self._parquet_filter_expression(dataset, filters))
+    
+    def _iter_parquet_object(
+        self,
+        object_key: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 10000,
+        limit: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a Parquet object with range reads, fetching only the needed columns and row groups"""
+        dataset = self._open_parquet_dataset(object_key)
+        
+        # Same semantics as the pandas path: unknown columns/filters are ignored
+        if columns:
+            schema_names = set(dataset.schema.names)
+            columns = [col for col in columns if col in schema_names] or None
+        expression = self._parquet_filter_expression(dataset, filters)
+        
+        # Row groups shrink after filtering, so coalesce batches up to batch_size rows
+        pending, pending_rows = [], 0
+        remaining = limit
+        for batch in dataset.to_batches(columns=columns, filter=expression, batch_size=batch_size):
+            if remaining is not None:
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            if batch.num_rows:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+            if pending_rows >= batch_size:
+                yield pa.Table.from_batches(pending).to_pandas(split_blocks=True, self_destruct=True)
+                pending, pending_rows = [], 0
+            if remaining == 0:
+                break
+        
+        if pending:
+            yield pa.Table.from_batches(pending).to_pandas(split_blocks=True, self_destruct=True)
+    
+    def _parse_s3_object_content(
+        self,
+        object_key: str,
+        content: bytes,
+        limit: Optional[int] = None,
+        usecols: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Parse S3 object content based on file extension"""
+        try:
+            # Determine file type from key; unknown types are treated as text
+            parser = self._PARSERS.get(self._ext_of(object_key), S3Connector._parse_text)
+            df = parser(self, content, limit, usecols)
             
             if limit:
                 df = df.head(limit)
@@ -435,24 +1178,123 @@ class S3Connector(DataSourceConnector):
             logger.error(f"Failed to parse S3 object {object_key}: {str(e)}")
             return pd.DataFrame()
     
-    def _infer_sql_type(self, series: pd.Series) -> str:
-        """Infer SQL type from pandas series"""
-        if series.dtype == 'object':
-            return 'TEXT'
-        elif series.dtype in ['int64', 'int32']:
-            return 'INTEGER'
-        elif series.dtype in ['float64', 'float32']:
-            return 'REAL'
-        elif series.dtype == 'bool':
-            return 'BOOLEAN'
-        elif 'datetime' in str(series.dtype):
-            return 'TIMESTAMP'
-        else:
-            return 'TEXT'
+    def _parse_csv(self, content: bytes, limit: Optional[int], usecols: Optional[List[str]]) -> pd.DataFrame:
+        return self._read_delimited(content, ',', limit, usecols)
+    
+    def _parse_tsv(self, content: bytes, limit: Optional[int], usecols: Optional[List[str]]) -> pd.DataFrame:
+        return self._read_delimited(content, '\t', limit, usecols)
+    
+    def _parse_json(self, content: bytes, limit: Optional[int], usecols: Optional[List[str]]) -> pd.DataFrame:
+        data = _json_loads(content)
+        if isinstance(data, list):
+            return pd.json_normalize(data)
+        return pd.json_normalize([data])
+    
+    def _parse_jsonl(self, content: bytes, limit: Optional[int], usecols: Optional[List[str]]) -> pd.DataFrame:
+        # JSON Lines format
+        return self._read_json_lines(content)
+    
+    def _parse_parquet(self, content: bytes, limit: Optional[int], usecols: Optional[List[str]]) -> pd.DataFrame:
+        if not PYARROW_AVAILABLE:
+            logger.error("PyArrow required for Parquet files")
+            return pd.DataFrame()
+        
+        import pyarrow.parquet as pq
+        return pq.read_table(io.BytesIO(content)).to_pandas()
+    
+    def _parse_text(self, content: bytes, limit: Optional[int], usecols: Optional[List[str]]) -> pd.DataFrame:
+        # Fallback: treat as text file
+        lines = content.decode('utf-8').split('\n')
+        return pd.DataFrame([{'line_number': i+1, 'content': line}
+                             for i, line in enumerate(lines) if line.strip()])
+    
+    # Parsers by file extension: (self, content, limit, usecols) -> DataFrame
+    _PARSERS = {
+        'csv': _parse_csv,
+        'tsv': _parse_tsv,
+        'json': _parse_json,
+        'jsonl': _parse_jsonl,
+        'parquet': _parse_parquet,
+        'pqt': _parse_parquet,
+        'txt': _parse_text,
+    }
+    
+    def _read_delimited(
+        self,
+        content: bytes,
+        sep: str,
+        limit: Optional[int] = None,
+        usecols: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Parse CSV/TSV bytes, only converting the requested columns"""
+        if usecols:
+            # Unknown columns are ignored, as with the column selection after parsing
+            header = pd.read_csv(io.BytesIO(content), sep=sep, nrows=0).columns
+            usecols = [col for col in header if col in set(usecols)] or None
+        
+        # The pyarrow engine is multithreaded but cannot stop early, so previews keep the C engine
+        if PYARROW_AVAILABLE and not limit:
+            try:
+                return pd.read_csv(io.BytesIO(content), sep=sep, usecols=usecols, engine='pyarrow')
+            except (pa.ArrowInvalid, ValueError) as e:
+                logger.debug(f"pyarrow could not parse delimited content, using fallback: {str(e)}")
+        
+        return pd.read_csv(io.BytesIO(content), sep=sep, usecols=usecols, nrows=limit)
+    
+    def _read_json_lines(self, content: bytes) -> pd.DataFrame:
+        """Parse JSON Lines bytes into a flattened DataFrame.
+        
+        Uses pyarrow's JSON reader when available; records with conflicting
+        types fall back to per-line parsing and json_normalize.
+        """
+        if not content.strip():
+            return pd.DataFrame()
+        if PYARROW_AVAILABLE:
+            try:
+                table = pa_json.read_json(
+                    io.BytesIO(content),
+                    read_options=pa_json.ReadOptions(block_size=JSON_BLOCK_SIZE),
+                    # One record per line lets pyarrow split blocks without scanning for quotes
+                    parse_options=pa_json.ParseOptions(newlines_in_values=False)
+                )
+                # Flatten nested objects into dotted columns like json_normalize
+                while any(pa.types.is_struct(field.type) for field in table.schema):
+                    table = table.flatten()
+                return table.to_pandas(self_destruct=True)
+            except pa.ArrowInvalid as e:
+                logger.debug(f"pyarrow could not parse JSON Lines, using fallback: {str(e)}")
+        
+        data = [_json_loads(line) for line in content.splitlines() if line.strip()]
+        return pd.json_normalize(data)
+    
+    def _infer_sql_types(self, df: pd.DataFrame) -> List[Dict[str, str]]:
+        """Infer SQL types for every column from its numpy dtype kind"""
+        return [
+            {'name': col, 'sql_type': _KIND_TO_SQL.get(dtype.kind, 'TEXT')}
+            for col, dtype in df.dtypes.items()
+        ]
     
     def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply basic filters to DataFrame"""
-        for column, value in filters.items():
+        """Apply basic filters to DataFrame with a single combined mask"""
+        mask = None
+        for column, op, value in self._iter_filter_predicates(filters):
             if column in df.columns:
-                df = df[df[column] == value]
-        return df
\ No newline at end of file
+                condition = _MASK_OPS[op](df[column], value).to_numpy(dtype=bool)
+                mask = condition if mask is None else np.logical_and(mask, condition, out=mask)
+        return df if mask is None else df.loc[mask]
+    
+    @staticmethod
+    def _iter_filter_predicates(filters: Optional[Dict[str, Any]]) -> Iterator[Tuple[str, str, Any]]:
+        """Normalize filters to (column, op, value); lists mean membership, dicts map ops to values"""
+        for column, value in (filters or {}).items():
+            if isinstance(value, dict):
+                operators = value
+            elif isinstance(value, (list, tuple)):
+                operators = {'in': list(value)}
+            else:
+                operators = {'eq': value}
+            
+            for op, val in operators.items():
+                if op not in _MASK_OPS or (op == 'in' and not isinstance(val, (list, tuple))):
+                    continue
+                yield column, op, val
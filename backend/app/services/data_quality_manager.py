@@ -3,12 +3,17 @@ Data Quality Management System
 Handles error isolation, dirty data quarantine, and data validation
 """
 
+import csv
+import io
+import os
 import uuid
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import logging
 
@@ -16,6 +21,18 @@ from app.services.local_storage import LocalStorage
 
 logger = logging.getLogger(__name__)
 
+# Column order of the CSV issue export, matching DataQualityManager._issue_to_dict
+ISSUE_EXPORT_FIELDS = [
+    'issue_id', 'issue_type', 'severity', 'column_name', 'row_index',
+    'value', 'expected_value', 'message', 'timestamp', 'metadata'
+]
+
+
+def _bulk_uuids(n: int) -> List[str]:
+    """Generate n random (version 4) UUID strings from a single urandom read"""
+    raw = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
 
 class DataQualityIssueType(Enum):
     """Types of data quality issues"""
@@ -65,6 +82,27 @@ class DataQualityReport:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class ColumnCache:
+    """Per-column results computed lazily and shared by every rule in one validation run"""
+    
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._isna: Dict[str, np.ndarray] = {}
+        self._inferred_types: Dict[str, str] = {}
+    
+    def isna(self, column: str) -> np.ndarray:
+        """Boolean null mask of a column"""
+        if column not in self._isna:
+            self._isna[column] = self.df[column].isna().to_numpy()
+        return self._isna[column]
+    
+    def inferred_type(self, column: str) -> str:
+        """pandas infer_dtype of a column, ignoring nulls"""
+        if column not in self._inferred_types:
+            self._inferred_types[column] = pd.api.types.infer_dtype(self.df[column], skipna=True)
+        return self._inferred_types[column]
+
+
 class DataQualityRule:
     """Base class for data quality validation rules"""
     
@@ -73,9 +111,15 @@ class DataQualityRule:
         self.name = name
         self.severity = severity
     
-    def validate(self, df: pd.DataFrame, column: Optional[str] = None) -> List[DataQualityIssue]:
-        """Validate data and return list of issues"""
+    def validate(self, df: pd.DataFrame, column: Optional[str] = None,
+                 cache: Optional[ColumnCache] = None) -> List[DataQualityIssue]:
+        """Validate data and return list of issues; cache shares per-column work between rules"""
         raise NotImplementedError
+    
+    def _present_columns(self, df: pd.DataFrame, columns) -> List[str]:
+        """Columns to check that exist in df, in check order, from one set intersection"""
+        present = set(df.columns).intersection(columns)
+        return [col for col in columns if col in present]
 
 
 class NotNullRule(DataQualityRule):
@@ -85,18 +129,24 @@ class NotNullRule(DataQualityRule):
         super().__init__("not_null", "Not Null Check", severity)
         self.columns = columns
     
-    def validate(self, df: pd.DataFrame, column: Optional[str] = None) -> List[DataQualityIssue]:
+    def validate(self, df: pd.DataFrame, column: Optional[str] = None,
+                 cache: Optional[ColumnCache] = None) -> List[DataQualityIssue]:
         issues = []
+        now = datetime.now()
+        cache = cache or ColumnCache(df)
         check_columns = [column] if column else self.columns
         
-        for col in check_columns:
-            if col not in df.columns:
+        for col in self._present_columns(df, check_columns):
+            isna = cache.isna(col)
+            if self._fast_pass(isna):
                 continue
                 
-            null_indices = df[df[col].isna()].index
-            for idx in null_indices:
-                issues.append(DataQualityIssue(
-                    issue_id=str(uuid.uuid4()),
+            # Locate nulls positionally instead of materializing a filtered frame
+            null_positions = np.flatnonzero(isna)
+            null_indices = df.index[null_positions].tolist()
+            issues.extend(
+                DataQualityIssue(
+                    issue_id=issue_id,
                     issue_type=DataQualityIssueType.NULL_VALUE,
                     severity=self.severity,
                     column_name=col,
@@ -104,10 +154,16 @@ class NotNullRule(DataQualityRule):
                     value=None,
                     expected_value="non-null value",
                     message=f"Null value found in column '{col}' at row {idx}",
-                    timestamp=datetime.now()
-                ))
+                    timestamp=now
+                )
+                for issue_id, idx in zip(_bulk_uuids(len(null_indices)), null_indices)
+            )
         
         return issues
+    
+    def _fast_pass(self, isna: np.ndarray) -> bool:
+        """Cheap check that the column has no nulls at all"""
+        return not isna.any()
 
 
 class DataTypeRule(DataQualityRule):
@@ -117,43 +173,111 @@ class DataTypeRule(DataQualityRule):
         super().__init__("data_type", "Data Type Check", severity)
         self.column_types = column_types
     
-    def validate(self, df: pd.DataFrame, column: Optional[str] = None) -> List[DataQualityIssue]:
+    def validate(self, df: pd.DataFrame, column: Optional[str] = None,
+                 cache: Optional[ColumnCache] = None) -> List[DataQualityIssue]:
         issues = []
+        now = datetime.now()
+        cache = cache or ColumnCache(df)
         check_columns = {column: self.column_types[column]} if column and column in self.column_types else self.column_types
         
-        for col, expected_type in check_columns.items():
-            if col not in df.columns:
+        for col in self._present_columns(df, check_columns):
+            expected_type = check_columns[col]
+            series = df[col]
+            if self._fast_pass(series, expected_type, cache, col):
                 continue
             
-            # Check each value in the column
-            for idx, value in df[col].items():
-                if pd.isna(value):
-                    continue
-                
-                is_valid = True
-                if expected_type == 'int':
-                    is_valid = isinstance(value, (int, np.integer)) or (isinstance(value, str) and value.isdigit())
-                elif expected_type == 'float':
-                    is_valid = isinstance(value, (int, float, np.number))
-                elif expected_type == 'str':
-                    is_valid = isinstance(value, str)
-                elif expected_type == 'datetime':
-                    is_valid = isinstance(value, (datetime, pd.Timestamp))
-                
-                if not is_valid:
-                    issues.append(DataQualityIssue(
-                        issue_id=str(uuid.uuid4()),
-                        issue_type=DataQualityIssueType.TYPE_MISMATCH,
-                        severity=self.severity,
-                        column_name=col,
-                        row_index=idx,
-                        value=value,
-                        expected_value=expected_type,
-                        message=f"Type mismatch in column '{col}' at row {idx}: expected {expected_type}, got {type(value).__name__}",
-                        timestamp=datetime.now()
-                    ))
+            bad_positions = np.flatnonzero(self._mismatch_mask(series, expected_type, cache.isna(col)))
+            if len(bad_positions) == 0:
+                continue
+            
+            bad_values = series.iloc[bad_positions].tolist()
+            issue_ids = _bulk_uuids(len(bad_positions))
+            for issue_id, idx, value in zip(issue_ids, df.index[bad_positions].tolist(), bad_values):
+                issues.append(DataQualityIssue(
+                    issue_id=issue_id,
+                    issue_type=DataQualityIssueType.TYPE_MISMATCH,
+                    severity=self.severity,
+                    column_name=col,
+                    row_index=idx,
+                    value=value,
+                    expected_value=expected_type,
+                    message=f"Type mismatch in column '{col}' at row {idx}: expected {expected_type}, got {type(value).__name__}",
+                    timestamp=now
+                ))
         
         return issues
+    
+    # Python types each expected type accepts; bool counts as int like isinstance does
+    _ACCEPTED_TYPES = {
+        'int': (int, np.integer),
+        'float': (int, float, np.number),
+        'str': (str,),
+        'datetime': (datetime, pd.Timestamp),
+    }
+    
+    # dtype kinds whose every (non-null) value is accepted
+    _ACCEPTED_KINDS = {
+        'int': 'iub',
+        'float': 'iufb',
+        'str': '',
+        'datetime': 'M',
+    }
+    
+    # infer_dtype results under which every (non-null) value is accepted
+    _ACCEPTED_INFERRED = {
+        'int': ('empty', 'integer'),
+        'float': ('empty', 'integer', 'floating', 'mixed-integer-float'),
+        'str': ('empty', 'string'),
+        'datetime': ('empty', 'datetime'),
+    }
+    
+    def _fast_pass(self, series: pd.Series, expected_type: str, cache: ColumnCache, column: str) -> bool:
+        """Cheap check that an object column already holds only accepted types"""
+        if not pd.api.types.is_object_dtype(series.dtype) or expected_type not in self._ACCEPTED_INFERRED:
+            # Typed columns are already decided from the dtype alone
+            return False
+        return cache.inferred_type(column) in self._ACCEPTED_INFERRED[expected_type]
+    
+    def _mismatch_mask(self, series: pd.Series, expected_type: str,
+                       isna: Optional[np.ndarray] = None) -> np.ndarray:
+        """Boolean mask of non-null values that are not of the expected type"""
+        if expected_type not in self._ACCEPTED_TYPES:
+            return np.zeros(len(series), dtype=bool)
+        
+        notna = ~(series.isna().to_numpy() if isna is None else isna)
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Check each category once and broadcast through the codes
+            category_mask = self._mismatch_mask(pd.Series(dtype.categories), expected_type)
+            codes = series.cat.codes.to_numpy()
+            mask = np.zeros(len(series), dtype=bool)
+            mask[notna] = category_mask[codes[notna]]
+            return mask
+        
+        if not pd.api.types.is_object_dtype(dtype) and not isinstance(dtype, pd.StringDtype):
+            # Homogeneous column: the dtype decides for every value at once
+            if dtype.kind in self._ACCEPTED_KINDS[expected_type]:
+                return np.zeros(len(series), dtype=bool)
+            return notna
+        
+        # Mixed object column: factorize the value types into integer codes,
+        # decide per distinct type, then broadcast with a single numpy take
+        type_codes, distinct_types = pd.factorize(series.map(type, na_action='ignore'))
+        
+        def types_matching(accepted) -> np.ndarray:
+            # Trailing False is picked by the -1 code of null values
+            matches = np.array([issubclass(t, accepted) for t in distinct_types] + [False], dtype=bool)
+            return matches[type_codes]
+        
+        valid = types_matching(self._ACCEPTED_TYPES[expected_type])
+        
+        if expected_type == 'int':
+            # Digit-only strings count as integers
+            str_positions = np.flatnonzero(types_matching(str))
+            if len(str_positions):
+                valid[str_positions] |= series.iloc[str_positions].str.isdigit().to_numpy(dtype=bool)
+        
+        return notna & ~valid
 
 
 class RangeRule(DataQualityRule):
@@ -163,21 +287,29 @@ class RangeRule(DataQualityRule):
         super().__init__("range", "Range Check", severity)
         self.column_ranges = column_ranges
     
-    def validate(self, df: pd.DataFrame, column: Optional[str] = None) -> List[DataQualityIssue]:
+    def validate(self, df: pd.DataFrame, column: Optional[str] = None,
+                 cache: Optional[ColumnCache] = None) -> List[DataQualityIssue]:
         issues = []
+        now = datetime.now()
         check_columns = {column: self.column_ranges[column]} if column and column in self.column_ranges else self.column_ranges
         
-        for col, (min_val, max_val) in check_columns.items():
-            if col not in df.columns:
+        for col in self._present_columns(df, check_columns):
+            min_val, max_val = check_columns[col]
+            series = df[col]
+            if self._fast_pass(series, min_val, max_val):
                 continue
             
-            out_of_range_mask = (df[col] < min_val) | (df[col] > max_val)
-            out_of_range_indices = df[out_of_range_mask].index
+            out_of_range_mask = ((series < min_val) | (series > max_val)).to_numpy(dtype=bool, na_value=False)
+            bad_positions = np.flatnonzero(out_of_range_mask)
+            if len(bad_positions) == 0:
+                continue
             
-            for idx in out_of_range_indices:
-                value = df.loc[idx, col]
+            # Fetch all violating values at once instead of a .loc lookup per row
+            bad_values = series.array[bad_positions]
+            issue_ids = _bulk_uuids(len(bad_positions))
+            for issue_id, idx, value in zip(issue_ids, df.index[bad_positions].tolist(), bad_values):
                 issues.append(DataQualityIssue(
-                    issue_id=str(uuid.uuid4()),
+                    issue_id=issue_id,
                     issue_type=DataQualityIssueType.RANGE_VIOLATION,
                     severity=self.severity,
                     column_name=col,
@@ -185,10 +317,23 @@ class RangeRule(DataQualityRule):
                     value=value,
                     expected_value=f"between {min_val} and {max_val}",
                     message=f"Value {value} in column '{col}' at row {idx} is outside range [{min_val}, {max_val}]",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         
         return issues
+    
+    def _fast_pass(self, series: pd.Series, min_val: Any, max_val: Any) -> bool:
+        """Cheap check that the column's extremes already lie within the range"""
+        if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)):
+            return False
+        # min/max skip nulls, so an all-null column has no extremes (NaN, or NA
+        # for nullable dtypes, which cannot be compared) and takes the slow path
+        if series.count() == 0:
+            return False
+        lo, hi = series.min(), series.max()
+        if pd.isna(lo) or pd.isna(hi):
+            return False
+        return bool(lo >= min_val and hi <= max_val)
 
 
 class UniqueRule(DataQualityRule):
@@ -198,22 +343,38 @@ class UniqueRule(DataQualityRule):
         super().__init__("unique", "Uniqueness Check", severity)
         self.columns = columns
     
-    def validate(self, df: pd.DataFrame, column: Optional[str] = None) -> List[DataQualityIssue]:
+    def validate(self, df: pd.DataFrame, column: Optional[str] = None,
+                 cache: Optional[ColumnCache] = None) -> List[DataQualityIssue]:
         issues = []
+        now = datetime.now()
         check_columns = [column] if column else self.columns
         
-        for col in check_columns:
-            if col not in df.columns:
+        for col in self._present_columns(df, check_columns):
+            if self._fast_pass(df[col]):
                 continue
             
-            # Find duplicate values
-            duplicated_mask = df.duplicated(subset=[col], keep=False)
-            duplicated_indices = df[duplicated_mask].index
+            # Group row positions by value in one pass; groups with more than
+            # one member are the duplicates
+            series = df[col]
+            groups = series.groupby(series, sort=False, observed=True).indices
+            duplicate_groups = [positions for positions in groups.values() if len(positions) > 1]
+            
+            # Nulls are matched as duplicated() does: repeats of the same kind
+            # of null (None, NaN, ...) are duplicates, different kinds are not
+            null_positions = np.flatnonzero(series.isna().to_numpy())
+            if len(null_positions) > 1:
+                null_duplicates = series.iloc[null_positions].duplicated(keep=False).to_numpy()
+                duplicate_groups.append(null_positions[null_duplicates])
+            if not any(len(positions) for positions in duplicate_groups):
+                continue
             
-            for idx in duplicated_indices:
-                value = df.loc[idx, col]
+            # Report in row order, fetching all duplicate values at once
+            dup_positions = np.sort(np.concatenate(duplicate_groups))
+            dup_values = series.array[dup_positions]
+            issue_ids = _bulk_uuids(len(dup_positions))
+            for issue_id, idx, value in zip(issue_ids, df.index[dup_positions].tolist(), dup_values):
                 issues.append(DataQualityIssue(
-                    issue_id=str(uuid.uuid4()),
+                    issue_id=issue_id,
                     issue_type=DataQualityIssueType.DUPLICATE_KEY,
                     severity=self.severity,
                     column_name=col,
@@ -221,10 +382,14 @@ class UniqueRule(DataQualityRule):
                     value=value,
                     expected_value="unique value",
                     message=f"Duplicate value '{value}' found in column '{col}' at row {idx}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         
         return issues
+    
+    def _fast_pass(self, series: pd.Series) -> bool:
+        """Cheap check that every value in the column is distinct"""
+        return series.is_unique
 
 
 class DataQualityManager:
@@ -233,7 +398,7 @@ class DataQualityManager:
     def __init__(self):
         self.storage = LocalStorage()
         self.rules: List[DataQualityRule] = []
-        self.quarantine_data: Dict[str, List[Dict[str, Any]]] = {}
+        self.quarantine_data: Dict[str, Dict[str, Any]] = {}
         
     def add_rule(self, rule: DataQualityRule):
         """Add a data quality validation rule"""
@@ -249,15 +414,22 @@ class DataQualityManager:
             dataset_id = str(uuid.uuid4())
         
         all_issues = []
+        rules = list(self.rules)
+        cache = ColumnCache(df)
         
-        # Run all validation rules
-        for rule in self.rules:
-            issues = rule.validate(df)
-            all_issues.extend(issues)
+        # Rules only read the frame, so they can run concurrently; pandas
+        # releases the GIL in most of the vectorized checks. map() keeps the
+        # issues in rule order.
+        if len(rules) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(rules), os.cpu_count() or 1)) as executor:
+                for issues in executor.map(lambda rule: rule.validate(df, cache=cache), rules):
+                    all_issues.extend(issues)
+        else:
+            for rule in rules:
+                all_issues.extend(rule.validate(df, cache=cache))
         
         # Calculate statistics
-        dirty_row_indices = set(issue.row_index for issue in all_issues if issue.row_index is not None)
-        dirty_rows = len(dirty_row_indices)
+        dirty_rows = len(self._dirty_row_labels(all_issues))
         clean_rows = len(df) - dirty_rows
         
         report = DataQualityReport(
@@ -272,26 +444,38 @@ class DataQualityManager:
         
         return report
     
+    def _dirty_row_labels(self, issues: List[DataQualityIssue]) -> pd.Index:
+        """Distinct row labels referenced by the issues, deduplicated in a typed hash table"""
+        row_indices = [issue.row_index for issue in issues if issue.row_index is not None]
+        return pd.Index(row_indices).unique()
+    
     def isolate_dirty_data(self, df: pd.DataFrame, report: DataQualityReport, 
                           isolation_strategy: str = "quarantine") -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Isolate dirty data based on quality report"""
         
         if isolation_strategy == "quarantine":
             # Remove rows with any issues
-            dirty_row_indices = set(issue.row_index for issue in report.issues if issue.row_index is not None)
-            clean_df = df.drop(index=dirty_row_indices)
-            dirty_df = df.loc[list(dirty_row_indices)] if dirty_row_indices else pd.DataFrame()
+            dirty_row_labels = self._dirty_row_labels(report.issues)
+            # One boolean mask splits the frame in a single pass, keeping row order
+            dirty_mask = df.index.isin(dirty_row_labels)
+            clean_df = df[~dirty_mask]
+            dirty_df = df[dirty_mask] if len(dirty_row_labels) else pd.DataFrame()
             
         elif isolation_strategy == "fix_and_continue":
             # Try to fix issues automatically and continue
             clean_df = df.copy()
             dirty_df = pd.DataFrame()
             
+            # Group null cells by column so each column is filled in one assignment
+            null_rows_by_column = defaultdict(list)
             for issue in report.issues:
                 if issue.issue_type == DataQualityIssueType.NULL_VALUE:
-                    # Fill null values with default
                     if issue.row_index is not None and issue.column_name:
-                        clean_df.loc[issue.row_index, issue.column_name] = ""
+                        null_rows_by_column[issue.column_name].append(issue.row_index)
+            
+            # Fill null values with default
+            for column_name, row_indices in null_rows_by_column.items():
+                clean_df.loc[row_indices, column_name] = ""
                         
         elif isolation_strategy == "ignore":
             # Continue with all data, log issues only
@@ -305,7 +489,8 @@ class DataQualityManager:
         if not dirty_df.empty:
             quarantine_id = f"{report.dataset_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             self.quarantine_data[quarantine_id] = {
-                'data': dirty_df.to_dict('records'),
+                **self._pack_quarantined_rows(dirty_df),
+                'row_count': len(dirty_df),
                 'issues': [self._issue_to_dict(issue) for issue in report.issues],
                 'timestamp': datetime.now().isoformat(),
                 'dataset_id': report.dataset_id
@@ -314,11 +499,28 @@ class DataQualityManager:
         return clean_df, dirty_df
     
     def get_quarantine_data(self, quarantine_id: Optional[str] = None) -> Dict[str, Any]:
-        """Get quarantined data"""
+        """Get quarantined data, decoding the stored rows into records"""
         if quarantine_id:
-            return self.quarantine_data.get(quarantine_id, {})
+            entry = self.quarantine_data.get(quarantine_id)
+            return self._unpack_quarantine_entry(entry) if entry else {}
         else:
-            return self.quarantine_data
+            return {qid: self._unpack_quarantine_entry(entry) for qid, entry in self.quarantine_data.items()}
+    
+    def _pack_quarantined_rows(self, dirty_df: pd.DataFrame) -> Dict[str, Any]:
+        """Store quarantined rows as a columnar parquet blob instead of one dict per row"""
+        try:
+            return {'data': dirty_df.to_parquet(index=False), 'data_format': 'parquet'}
+        except Exception as e:
+            # Mixed-type object columns and non-string column names can't be written as parquet
+            logger.debug(f"Keeping quarantined rows as records, parquet encoding failed: {e}")
+            return {'data': dirty_df.to_dict('records'), 'data_format': 'records'}
+    
+    def _unpack_quarantine_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Quarantine entry with its rows decoded to records"""
+        unpacked = {key: value for key, value in entry.items() if key != 'data_format'}
+        if entry.get('data_format') == 'parquet':
+            unpacked['data'] = pd.read_parquet(io.BytesIO(entry['data'])).to_dict('records')
+        return unpacked
     
     def create_validation_profile(self, df: pd.DataFrame, sample_size: int = 1000) -> Dict[str, DataQualityRule]:
         """Automatically create data quality rules based on dataset analysis"""
@@ -326,32 +528,37 @@ class DataQualityManager:
         rules = {}
         
         for column in sample_df.columns:
-            col_data = sample_df[column].dropna()
+            # One null mask serves both the sample filtering and, when the
+            # whole dataset is the sample, the not-null check
+            sample_nulls = sample_df[column].isna().to_numpy()
+            col_data = sample_df[column][~sample_nulls]
             
             if len(col_data) == 0:
                 continue
             
             # Check if column has null values in full dataset
-            if df[column].isna().any():
+            has_nulls = sample_nulls.any() if sample_df is df else df[column].isna().to_numpy().any()
+            if has_nulls:
                 rules[f"{column}_not_null"] = NotNullRule([column])
             
             # Detect data type
+            numeric_type = None
             if col_data.dtype in ['int64', 'int32']:
-                rules[f"{column}_type"] = DataTypeRule({column: 'int'})
-                # Add range rule for numeric data
-                min_val, max_val = col_data.min(), col_data.max()
-                rules[f"{column}_range"] = RangeRule({column: (min_val, max_val)})
-                
+                numeric_type = 'int'
             elif col_data.dtype in ['float64', 'float32']:
-                rules[f"{column}_type"] = DataTypeRule({column: 'float'})
-                min_val, max_val = col_data.min(), col_data.max()
-                rules[f"{column}_range"] = RangeRule({column: (min_val, max_val)})
+                numeric_type = 'float'
+            
+            if numeric_type:
+                rules[f"{column}_type"] = DataTypeRule({column: numeric_type})
+                # Add range rule for numeric data
+                values = col_data.to_numpy()
+                rules[f"{column}_range"] = RangeRule({column: (values.min(), values.max())})
                 
             elif col_data.dtype == 'object':
                 rules[f"{column}_type"] = DataTypeRule({column: 'str'})
             
             # Check for uniqueness (if column looks like an ID)
-            if 'id' in column.lower() or len(col_data.unique()) == len(col_data):
+            if 'id' in column.lower() or col_data.is_unique:
                 rules[f"{column}_unique"] = UniqueRule([column])
         
         return rules
@@ -401,12 +608,17 @@ class DataQualityManager:
         elif format == "csv":
             filepath = os.path.join(temp_dir, f"quality_issues_{timestamp}.csv")
             
-            issues_data = []
-            for issue in report.issues:
-                issues_data.append(self._issue_to_dict(issue))
-            
-            issues_df = pd.DataFrame(issues_data)
-            issues_df.to_csv(filepath, index=False)
+            # Stream one row per issue instead of building a list of dicts and a DataFrame
+            with open(filepath, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=ISSUE_EXPORT_FIELDS)
+                writer.writeheader()
+                for issue in report.issues:
+                    record = self._issue_to_dict(issue)
+                    for key in ('value', 'expected_value'):
+                        # Missing values are written as empty cells, like to_csv did
+                        if pd.api.types.is_scalar(record[key]) and pd.isna(record[key]):
+                            record[key] = ''
+                    writer.writerow(record)
             
         else:
             raise ValueError(f"Unsupported export format: {format}")
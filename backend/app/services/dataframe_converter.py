@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 
 # Shared boolean conversion mapping
@@ -12,44 +13,145 @@ BOOLEAN_CONVERSION_MAP = {
     True: True, False: False
 }
 
+# Case-insensitive string spellings accepted for explicitly BOOLEAN columns
+TRUE_STRINGS = frozenset({'true', 't', 'yes', 'y', '1'})
+FALSE_STRINGS = frozenset({'false', 'f', 'no', 'n', '0'})
 
-def convert_dataframe_types_from_detection(df: pd.DataFrame, column_types: Dict[str, str]) -> pd.DataFrame:
+NULLABLE_INT_DTYPES = ['Int8', 'Int16', 'Int32', 'Int64']
+
+# Integer columns loaded into date/time columns are read as unix epochs once
+# their largest magnitude reaches EPOCH_MIN_MAGNITUDE (smaller numbers, such as
+# YYYYMMDD dates, are left to pd.to_datetime); the unit is the first whose
+# upper bound exceeds it
+EPOCH_MIN_MAGNITUDE = 10 ** 8
+EPOCH_UNIT_BOUNDS = [('s', 10 ** 11), ('ms', 10 ** 14), ('us', 10 ** 17), ('ns', None)]
+
+
+def _narrowest_int_dtype(numeric: pd.Series, max_dtype: str) -> str:
+    """Smallest nullable integer dtype that holds every value, capped at max_dtype"""
+    low, high = numeric.min(), numeric.max()
+    if pd.isna(low):
+        return max_dtype
+    
+    for dtype in NULLABLE_INT_DTYPES[:NULLABLE_INT_DTYPES.index(max_dtype)]:
+        bounds = np.iinfo(dtype.lower())
+        if bounds.min <= low and high <= bounds.max:
+            return dtype
+    return max_dtype
+
+
+def _downcast_float(numeric: pd.Series) -> pd.Series:
+    """Downcast a float64 column to float32 only when no value changes"""
+    if numeric.dtype != np.float64:
+        return numeric
+    
+    downcast = numeric.astype(np.float32)
+    if np.array_equal(downcast.to_numpy(dtype=np.float64), numeric.to_numpy(), equal_nan=True):
+        return downcast
+    return numeric
+
+
+def _integer_converter(max_dtype: str) -> Callable[[pd.Series], pd.Series]:
+    """Build a converter to the narrowest nullable integer dtype, capped at max_dtype"""
+    def convert(series: pd.Series) -> pd.Series:
+        numeric = pd.to_numeric(series, errors='coerce')
+        return numeric.astype(_narrowest_int_dtype(numeric, max_dtype))
+    return convert
+
+
+def _float_converter(series: pd.Series) -> pd.Series:
+    return _downcast_float(pd.to_numeric(series, errors='coerce'))
+
+
+def _insert_float_converter(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(series, errors='coerce')
+
+
+def _numeric_text_converter(series: pd.Series) -> pd.Series:
+    # Keep as string for NUMERIC type to preserve precision
+    return series.astype(str)
+
+
+def _datetime_converter(series: pd.Series) -> pd.Series:
+    epochs = _epoch_integers(series)
+    if epochs is None:
+        return pd.to_datetime(series, errors='coerce')
+    
+    magnitude = epochs.abs().max()
+    unit = next(unit for unit, bound in EPOCH_UNIT_BOUNDS if bound is None or magnitude < bound)
+    return pd.to_datetime(epochs, unit=unit, errors='coerce')
+
+
+def _epoch_integers(series: pd.Series) -> Optional[pd.Series]:
+    """
+    Values of an integer column of unix epoch timestamps, or None when the
+    column does not hold one. Without this, pd.to_datetime reads integers as
+    nanoseconds. Text columns are left to pd.to_datetime, as digit strings
+    such as '20240115123000' are compact timestamps rather than epochs.
+    """
+    if not pd.api.types.is_integer_dtype(series):
+        return None
+    
+    magnitude = series.abs().max()
+    if pd.isna(magnitude) or magnitude < EPOCH_MIN_MAGNITUDE:
+        return None
+    return series
+
+
+# Text columns become categorical below this distinct/total ratio
+CATEGORICAL_MAX_RATIO = 0.5
+CATEGORICAL_MAX_CATEGORIES = 2 ** 16
+
+
+def _is_low_cardinality(series: pd.Series) -> bool:
+    """Check whether a text column repeats enough to be worth storing as categories"""
+    if len(series) == 0:
+        return False
+    distinct = series.nunique(dropna=True)
+    return distinct < CATEGORICAL_MAX_CATEGORIES and distinct / len(series) < CATEGORICAL_MAX_RATIO
+
+
+def convert_dataframe_types_from_detection(
+    df: pd.DataFrame,
+    column_types: Dict[str, str],
+    compact: bool = True
+) -> pd.DataFrame:
     """
     Convert DataFrame types based on detected SQL types
     
     Args:
         df: Input DataFrame
         column_types: Mapping of column names to detected SQL types
+        compact: Whether to shrink the result for keeping in memory (float32
+            downcasts, categorical text); pass False for frames that are
+            written to a table, as to_sql would create float32 columns as REAL
         
     Returns:
         DataFrame with converted column types
     """
-    df_converted = df.copy()
+    converters = SQL_TYPE_CONVERTERS if compact else INSERT_SQL_TYPE_CONVERTERS
+    converted_columns = {}
     
     for col, sql_type in column_types.items():
-        if col not in df_converted.columns:
+        if col not in df.columns:
             continue
             
-        series = df_converted[col]
+        series = df[col]
         
         # Convert based on SQL type
-        if sql_type == "SMALLINT":
-            df_converted[col] = pd.to_numeric(series, errors='coerce').astype('Int16')
-        elif sql_type == "INTEGER":
-            df_converted[col] = pd.to_numeric(series, errors='coerce').astype('Int32')
-        elif sql_type == "BIGINT":
-            df_converted[col] = pd.to_numeric(series, errors='coerce').astype('Int64')
-        elif sql_type == "DOUBLE PRECISION":
-            df_converted[col] = pd.to_numeric(series, errors='coerce')
-        elif sql_type == "NUMERIC":
-            # Keep as string for NUMERIC type to preserve precision
-            df_converted[col] = series.astype(str)
-        elif sql_type == "BOOLEAN":
-            # Convert various boolean representations
-            df_converted[col] = series.map(BOOLEAN_CONVERSION_MAP)
-        elif sql_type in ["DATE", "TIMESTAMP"]:
-            df_converted[col] = pd.to_datetime(series, errors='coerce')
-        # For VARCHAR and TEXT, keep as object (string)
+        converter = converters.get(sql_type)
+        if converter is not None:
+            converted_columns[col] = converter(series)
+        elif compact and series.dtype == object and _is_low_cardinality(series):
+            # Repetitive VARCHAR/TEXT columns are stored as categories
+            converted_columns[col] = series.astype('category')
+        # Otherwise VARCHAR and TEXT stay as object (string)
+    
+    # Shallow copy: untouched columns share their data with the input frame,
+    # and assigning a converted column replaces it without writing into df
+    df_converted = df.copy(deep=False)
+    for col, converted in converted_columns.items():
+        df_converted[col] = converted
     
     return df_converted
 
@@ -62,9 +164,38 @@ def convert_boolean_column(series: pd.Series) -> pd.Series:
         series: Input pandas Series
         
     Returns:
-        Series with boolean values
+        Series with nullable boolean values; unmapped values and nulls become <NA>
     """
-    return series.map(BOOLEAN_CONVERSION_MAP)
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype('boolean')
+    
+    if pd.api.types.is_numeric_dtype(series):
+        # Only 0 and 1 have a boolean meaning; compare the whole array at once
+        numbers = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = pd.arrays.BooleanArray(numbers == 1, (numbers != 0) & (numbers != 1))
+        return pd.Series(values, index=series.index, name=series.name)
+    
+    # Look up each distinct value once, then broadcast through the codes
+    codes, uniques = pd.factorize(series)
+    flags = [_boolean_value(value) for value in uniques]
+    is_true = np.array([flag is True for flag in flags] + [False])
+    is_known = np.array([flag is not None for flag in flags] + [False])
+    
+    # The trailing entries are picked by the -1 code of null values
+    values = pd.arrays.BooleanArray(is_true[codes], ~is_known[codes])
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _boolean_value(value) -> Optional[bool]:
+    """Boolean meaning of a single value, or None when it has none"""
+    if isinstance(value, str):
+        key = value.strip().lower()
+        if key in TRUE_STRINGS:
+            return True
+        if key in FALSE_STRINGS:
+            return False
+        return None
+    return BOOLEAN_CONVERSION_MAP.get(value)
 
 
 def convert_numeric_column(series: pd.Series, target_type: str) -> pd.Series:
@@ -96,4 +227,54 @@ def convert_datetime_column(series: pd.Series) -> pd.Series:
     Returns:
         Series with datetime values
     """
-    return pd.to_datetime(series, errors='coerce')
\ No newline at end of file
+    return pd.to_datetime(series, errors='coerce')
+
+
+def convert_date_column(series: pd.Series) -> pd.Series:
+    """
+    Convert a pandas Series to dates
+    
+    Args:
+        series: Input pandas Series
+        
+    Returns:
+        Series of datetime.date objects; unparseable values and nulls become NaT
+    """
+    datetimes = _datetime_converter(series)
+    
+    # Build one date object per distinct value, then broadcast through the codes
+    codes, uniques = pd.factorize(datetimes)
+    dates = np.empty(len(uniques) + 1, dtype=object)
+    dates[:-1] = pd.DatetimeIndex(uniques).date
+    # The trailing entry is picked by the -1 code of null values
+    dates[-1] = pd.NaT
+    return pd.Series(dates[codes], index=series.index, name=series.name)
+
+
+# Column converter for each SQL type, including common aliases. Shared by
+# detection-based and CREATE TABLE driven imports so both convert alike.
+SQL_TYPE_CONVERTERS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    "SMALLINT": _integer_converter('Int16'),
+    "INT2": _integer_converter('Int16'),
+    "INTEGER": _integer_converter('Int32'),
+    "INT": _integer_converter('Int32'),
+    "INT4": _integer_converter('Int32'),
+    "BIGINT": _integer_converter('Int64'),
+    "INT8": _integer_converter('Int64'),
+    "DOUBLE PRECISION": _float_converter,
+    "FLOAT8": _float_converter,
+    "REAL": _float_converter,
+    "FLOAT4": _float_converter,
+    "NUMERIC": _numeric_text_converter,
+    "BOOLEAN": convert_boolean_column,
+    "DATE": _datetime_converter,
+    "TIMESTAMP": _datetime_converter,
+    "DATETIME": _datetime_converter,
+}
+
+# Converters for frames that are written out and then dropped, where checking
+# for a lossless float32 downcast costs more than the memory it would save
+INSERT_SQL_TYPE_CONVERTERS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    sql_type: _insert_float_converter if converter is _float_converter else converter
+    for sql_type, converter in SQL_TYPE_CONVERTERS.items()
+}
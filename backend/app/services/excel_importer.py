@@ -1,27 +1,111 @@
 import pandas as pd
 import io
-from typing import List, Optional
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import BinaryIO, List, Optional, Tuple, Union
 from fastapi import UploadFile, HTTPException
-from sqlalchemy.orm import Session
-from openpyxl import load_workbook
+from sqlalchemy.orm import Session, sessionmaker
 
 from .csv_importer import create_table_from_dataframe, generate_create_table_sql
-from app.services.type_detection import detect_column_type
-from app.services.column_utils import build_column_preview_info, generate_table_name_from_filename
+from app.services.type_detection import detect_column_type, detect_column_types
+from app.services.column_utils import (
+    build_column_preview_info,
+    generate_table_name_from_filename,
+    normalize_column_labels,
+)
 from app.services.dataframe_converter import convert_dataframe_types_from_detection
+from app.services.bulk_insert import bulk_insert_dataframe
 
+logger = logging.getLogger(__name__)
 
-def get_excel_sheets(file_content: bytes) -> List[str]:
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Engine used to read workbooks: calamine parses .xlsx and .xls natively and
+# is much faster than openpyxl; None lets pandas pick by file format
+EXCEL_READ_ENGINE = 'calamine' if CALAMINE_AVAILABLE else None
+
+
+# Upper bound on sheets imported concurrently by import_excel_all_sheets
+MAX_PARALLEL_SHEET_IMPORTS = 4
+
+# Data rows parsed for previews; type detection runs on this sample
+PREVIEW_SAMPLE_ROWS = 5000
+
+
+def open_excel_file(
+    file_content: Union[bytes, BinaryIO],
+    engine: Optional[str] = EXCEL_READ_ENGINE
+) -> pd.ExcelFile:
     """
-    Get list of sheet names from an Excel file
+    Open an Excel workbook once so any of its sheets can be parsed without
+    re-reading the file bytes. File objects such as an upload's spooled file
+    are read in place from the start, without copying them into memory
+    first. Uses calamine when installed; workbooks it
+    cannot read are retried with the engine pandas picks for the format
+    (openpyxl for .xlsx, loaded read-only). Use it as a context manager so
+    the workbook is closed afterwards.
     """
+    source = file_content if hasattr(file_content, 'read') else io.BytesIO(file_content)
+    try:
+        source.seek(0)
+        return pd.ExcelFile(source, engine=engine)
+    except Exception as e:
+        if engine != 'calamine':
+            raise HTTPException(status_code=400, detail=f"Failed to read Excel file: {str(e)}")
+        logger.warning(f"calamine could not read the workbook, falling back to the default engine: {e}")
+    
     try:
-        workbook = load_workbook(io.BytesIO(file_content), read_only=True)
-        return workbook.sheetnames
+        source.seek(0)
+        return pd.ExcelFile(source)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to read Excel file: {str(e)}")
 
 
+def get_excel_sheets(file_content: Union[bytes, BinaryIO]) -> List[str]:
+    """
+    Get list of sheet names from an Excel file
+    """
+    with open_excel_file(file_content) as excel_file:
+        return excel_file.sheet_names
+
+
+def _sheet_max_row(excel_file: pd.ExcelFile, sheet_name: str) -> Optional[int]:
+    """Last used row recorded in a sheet's dimensions, or None if unknown"""
+    try:
+        if excel_file.engine == 'calamine':
+            last_row, _ = excel_file.book.get_sheet_by_name(sheet_name).end
+            return last_row + 1
+        return excel_file.book[sheet_name].max_row
+    except Exception:
+        # Engines without openpyxl-style worksheets report no dimensions
+        return None
+
+
+def read_sheet_sample(
+    excel_file: pd.ExcelFile,
+    sheet_name: str,
+    sample_rows: int = PREVIEW_SAMPLE_ROWS
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Parse at most sample_rows data rows of a sheet, returning the sample and
+    the sheet's total data row count estimated from its recorded dimensions
+    """
+    max_row = _sheet_max_row(excel_file, sheet_name)
+    
+    if max_row is None or max_row - 1 <= sample_rows:
+        df = excel_file.parse(sheet_name=sheet_name)
+        return df, len(df)
+    
+    return excel_file.parse(sheet_name=sheet_name, nrows=sample_rows), max_row - 1
+
+
 async def import_excel_to_table(
     db: Session,
     file: UploadFile,
@@ -33,10 +117,48 @@ async def import_excel_to_table(
     """
     Import Excel file to database table with type detection
     """
-    contents = await file.read()
+    # Close the workbook as soon as the sheet is parsed, so its reader state
+    # is not held in memory while the rows are converted and inserted
+    with open_excel_file(file.file) as excel_file:
+        df, selected_sheet, sheets = _parse_excel_sheet(excel_file, sheet_name)
     
+    return _import_sheet_dataframe(
+        db, df, file.filename, table_name, selected_sheet, sheets, create_table, detect_types
+    )
+
+
+def _import_excel_sheet(
+    db: Session,
+    excel_file: pd.ExcelFile,
+    filename: Optional[str],
+    table_name: str,
+    sheet_name: Optional[str] = None,
+    create_table: bool = True,
+    detect_types: bool = True,
+    parse_lock: Optional[threading.Lock] = None
+) -> dict:
+    """
+    Import one sheet of an already opened workbook to a database table.
+    Pass parse_lock when several threads share the workbook, since the
+    underlying workbook readers are not thread-safe.
+    """
+    df, selected_sheet, sheets = _parse_excel_sheet(excel_file, sheet_name, parse_lock)
+    return _import_sheet_dataframe(
+        db, df, filename, table_name, selected_sheet, sheets, create_table, detect_types
+    )
+
+
+def _parse_excel_sheet(
+    excel_file: pd.ExcelFile,
+    sheet_name: Optional[str] = None,
+    parse_lock: Optional[threading.Lock] = None
+) -> Tuple[pd.DataFrame, str, List[str]]:
+    """
+    Parse one sheet of an open workbook (the first if sheet_name is not
+    given), returning its rows, the selected sheet and all sheet names
+    """
     # Get available sheets
-    sheets = get_excel_sheets(contents)
+    sheets = excel_file.sheet_names
     
     if not sheets:
         raise HTTPException(status_code=400, detail="No sheets found in Excel file")
@@ -50,17 +172,34 @@ async def import_excel_to_table(
     
     selected_sheet = sheet_name or sheets[0]
     
-    # Read the Excel file
+    # Parse the sheet from the open workbook
     try:
-        df = pd.read_excel(io.BytesIO(contents), sheet_name=selected_sheet, engine='openpyxl')
+        with parse_lock or nullcontext():
+            df = excel_file.parse(sheet_name=selected_sheet)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse Excel file: {str(e)}")
     
     if df.empty:
         raise HTTPException(status_code=400, detail=f"Sheet '{selected_sheet}' is empty")
     
+    return df, selected_sheet, sheets
+
+
+def _import_sheet_dataframe(
+    db: Session,
+    df: pd.DataFrame,
+    filename: Optional[str],
+    table_name: str,
+    selected_sheet: str,
+    sheets: List[str],
+    create_table: bool = True,
+    detect_types: bool = True
+) -> dict:
+    """
+    Detect types for the parsed rows of a sheet and load them into a table
+    """
     if not table_name:
-        filename = file.filename or "uploaded_table"
+        filename = filename or "uploaded_table"
         # Generate table name using shared utility
         if len(sheets) > 1:
             table_name = generate_table_name_from_filename(filename, selected_sheet)
@@ -72,17 +211,20 @@ async def import_excel_to_table(
     type_conversions = {}
     
     if detect_types:
-        for col in df.columns:
-            sql_type, pandas_dtype = detect_column_type(df[col])
+        for col, (sql_type, pandas_dtype) in detect_column_types(df).items():
             column_types[col] = sql_type
             type_conversions[col] = pandas_dtype
-        
-        # Convert DataFrame types using shared utility
-        df = convert_dataframe_types_from_detection(df, column_types)
     
     # Rename columns to be SQL-safe
     original_columns = list(df.columns)
-    df.columns = [str(col).strip().replace(' ', '_').replace('-', '_').lower() for col in df.columns]
+    df.columns = normalize_column_labels(df.columns)
+    
+    # Detected types keyed by the SQL-safe names, for converting renamed rows
+    renamed_column_types = {
+        new_col: column_types[orig_col]
+        for orig_col, new_col in zip(original_columns, df.columns)
+        if orig_col in column_types
+    }
     
     if create_table and detect_types:
         # Create mapping with original column names for create_table_from_dataframe
@@ -91,9 +233,19 @@ async def import_excel_to_table(
         
         # Create table with proper types
         create_table_from_dataframe(db, df, table_name, original_column_types)
-        # Insert data
-        df.to_sql(table_name, con=db.get_bind(), if_exists='append', index=False, method='multi')
+        # Insert data, converting DataFrame types one chunk at a time so the
+        # converted rows never need a second full copy of the sheet in memory
+        bulk_insert_dataframe(
+            db.get_bind(), table_name, df,
+            convert=lambda chunk: convert_dataframe_types_from_detection(
+                chunk, renamed_column_types, compact=False
+            )
+        )
     else:
+        if detect_types:
+            # Convert DataFrame types using shared utility; to_sql would create
+            # float32 columns as REAL, so the frame is not compacted
+            df = convert_dataframe_types_from_detection(df, renamed_column_types, compact=False)
         # Use pandas default behavior
         df.to_sql(table_name, con=db.get_bind(), if_exists='replace', index=False)
     
@@ -131,49 +283,63 @@ async def import_excel_all_sheets(
     """
     Import all sheets from an Excel file into separate tables
     """
-    contents = await file.read()
-    sheets = get_excel_sheets(contents)
-    
-    if not sheets:
-        raise HTTPException(status_code=400, detail="No sheets found in Excel file")
-    
-    if not table_prefix:
-        filename = file.filename or "uploaded"
-        table_prefix = generate_table_name_from_filename(filename)
-    
-    results = []
-    total_rows = 0
-    
-    for sheet in sheets:
-        try:
-            # Create a new file-like object for each sheet import
-            file_copy = UploadFile(
-                filename=file.filename,
-                file=io.BytesIO(contents)
-            )
-            
+    with open_excel_file(file.file) as excel_file:
+        sheets = excel_file.sheet_names
+        
+        if not sheets:
+            raise HTTPException(status_code=400, detail="No sheets found in Excel file")
+        
+        if not table_prefix:
+            filename = file.filename or "uploaded"
+            table_prefix = generate_table_name_from_filename(filename)
+        
+        # Sheets are independent, so type detection and inserts run in
+        # parallel threads. Each thread gets its own session because Session
+        # is not thread-safe, while parsing the shared workbook is serialized.
+        session_factory = sessionmaker(bind=db.get_bind())
+        parse_lock = threading.Lock()
+        
+        def import_sheet(sheet: str) -> dict:
             # Generate table name for this sheet
             sheet_table_name = f"{table_prefix}_{sheet.lower().replace(' ', '_')}"
             
-            # Import the sheet
-            result = await import_excel_to_table(
-                db=db,
-                file=file_copy,
-                table_name=sheet_table_name,
-                sheet_name=sheet,
-                create_table=create_table,
-                detect_types=detect_types
+            with session_factory() as sheet_db:
+                return _import_excel_sheet(
+                    db=sheet_db,
+                    excel_file=excel_file,
+                    filename=file.filename,
+                    table_name=sheet_table_name,
+                    sheet_name=sheet,
+                    create_table=create_table,
+                    detect_types=detect_types,
+                    parse_lock=parse_lock
+                )
+        
+        # Submit the largest sheets first so a big sheet queued last does not
+        # run alone after the others finish; results keep the workbook order
+        submit_order = sorted(sheets, key=lambda sheet: _sheet_max_row(excel_file, sheet) or 0, reverse=True)
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=min(len(sheets), MAX_PARALLEL_SHEET_IMPORTS)) as executor:
+            futures = {sheet: loop.run_in_executor(executor, import_sheet, sheet) for sheet in submit_order}
+            outcomes = await asyncio.gather(
+                *[futures[sheet] for sheet in sheets],
+                return_exceptions=True
             )
-            
-            results.append(result)
-            total_rows += result["row_count"]
-            
-        except Exception as e:
+    
+    results = []
+    total_rows = 0
+    
+    for sheet, outcome in zip(sheets, outcomes):
+        if isinstance(outcome, BaseException):
             results.append({
                 "sheet_name": sheet,
-                "error": str(e),
+                "error": str(outcome),
                 "status": "failed"
             })
+        else:
+            results.append(outcome)
+            total_rows += outcome["row_count"]
     
     return {
         "message": f"Imported {len([r for r in results if 'error' not in r])} sheets with {total_rows} total rows",
@@ -187,39 +353,40 @@ def preview_excel_data(file_content: bytes, sheet_name: Optional[str] = None, ro
     """
     Preview Excel file data without importing - matches CSV preview format
     """
-    sheets = get_excel_sheets(file_content)
-    
-    if not sheets:
-        raise HTTPException(status_code=400, detail="No sheets found in Excel file")
-    
-    selected_sheet = sheet_name or sheets[0]
-    
-    if selected_sheet not in sheets:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Sheet '{selected_sheet}' not found. Available sheets: {', '.join(sheets)}"
-        )
-    
-    # Read the full file to get accurate row count, but limit preview
-    df_full = pd.read_excel(io.BytesIO(file_content), sheet_name=selected_sheet, engine='openpyxl')
-    df = df_full.head(rows)
+    with open_excel_file(file_content) as excel_file:
+        sheets = excel_file.sheet_names
+        
+        if not sheets:
+            raise HTTPException(status_code=400, detail="No sheets found in Excel file")
+        
+        selected_sheet = sheet_name or sheets[0]
+        
+        if selected_sheet not in sheets:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Sheet '{selected_sheet}' not found. Available sheets: {', '.join(sheets)}"
+            )
+        
+        # Parse a bounded sample; the row count comes from the sheet dimensions
+        df_sample, total_rows = read_sheet_sample(excel_file, selected_sheet, max(rows, PREVIEW_SAMPLE_ROWS))
+    df = df_sample.head(rows)
     
     # Build columns info in CSV preview format
     columns = []
     column_types_dict = {}
     
-    for col in df_full.columns:
-        sql_type, _ = detect_column_type(df_full[col])
+    for col in df_sample.columns:
+        sql_type, _ = detect_column_type(df_sample[col])
         column_types_dict[col] = sql_type
         
         # Build column preview info using shared utility
-        series = df_full[col]
+        series = df_sample[col]
         column_info = build_column_preview_info(series, str(col), sql_type)
         columns.append(column_info)
     
     # Generate CREATE TABLE SQL
     suggested_table_name = f"sheet_{selected_sheet.lower().replace(' ', '_')}"
-    create_table_sql, _, _ = generate_create_table_sql(df_full, suggested_table_name, column_types_dict)
+    create_table_sql, _, _ = generate_create_table_sql(df_sample, suggested_table_name, column_types_dict)
     
     # Get sample data
     sample_data = df.to_dict('records')
@@ -227,7 +394,9 @@ def preview_excel_data(file_content: bytes, sheet_name: Optional[str] = None, ro
     return {
         "columns": columns,
         "sample_data": sample_data,
-        "total_rows": len(df_full),
+        "total_rows": total_rows,
+        # Column stats cover only these rows when fewer than total_rows
+        "sampled_rows": len(df_sample),
         "create_table_sql": create_table_sql,
         "suggested_table_name": suggested_table_name,
         "sheet_name": selected_sheet,
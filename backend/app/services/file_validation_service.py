@@ -1,14 +1,20 @@
-from typing import List, Union
+from typing import Sequence, Union
 from fastapi import HTTPException, UploadFile
 
 
-def validate_file_format(filename: Union[str, UploadFile], allowed_extensions: List[str], file_type_name: str) -> None:
+# Lower-case extensions accepted for each upload type
+CSV_EXTENSIONS = ('.csv',)
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+
+
+def validate_file_format(filename: Union[str, UploadFile], allowed_extensions: Sequence[str], file_type_name: str) -> None:
     """
     Validate file format against allowed extensions
     
     Args:
         filename: Name of the uploaded file or UploadFile object
-        allowed_extensions: List of allowed file extensions (e.g., ['.csv', '.xlsx'])
+        allowed_extensions: Allowed lower-case file extensions (e.g., ('.csv', '.xlsx')),
+            matched case-insensitively
         file_type_name: Human-readable file type name for error messages
     
     Raises:
@@ -21,7 +27,7 @@ def validate_file_format(filename: Union[str, UploadFile], allowed_extensions: L
         actual_filename = filename
     
     # Ensure actual_filename is a string and not None
-    if actual_filename and isinstance(actual_filename, str) and not any(actual_filename.endswith(ext) for ext in allowed_extensions):
+    if actual_filename and isinstance(actual_filename, str) and not actual_filename.lower().endswith(tuple(allowed_extensions)):
         formats = ", ".join(allowed_extensions)
         raise HTTPException(
             status_code=400, 
@@ -31,9 +37,9 @@ def validate_file_format(filename: Union[str, UploadFile], allowed_extensions: L
 
 def validate_csv_file(file: Union[str, UploadFile]) -> None:
     """Validate CSV file format"""
-    validate_file_format(file, ['.csv'], "CSV")
+    validate_file_format(file, CSV_EXTENSIONS, "CSV")
 
 
 def validate_excel_file(file: Union[str, UploadFile]) -> None:
     """Validate Excel file format"""
-    validate_file_format(file, ['.xlsx', '.xls'], "Excel")
\ No newline at end of file
+    validate_file_format(file, EXCEL_EXTENSIONS, "Excel")
\ No newline at end of file
@@ -1,111 +1,216 @@
 import pandas as pd
-import io
 import re
 import json
-from typing import Dict, List, Optional
+import logging
+from functools import lru_cache, partial
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 from fastapi import UploadFile
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.services.column_utils import sanitize_column_name
+from app.services.dataframe_converter import INSERT_SQL_TYPE_CONVERTERS, convert_date_column
+from app.services.bulk_insert import COPY_CHUNK_ROWS, bulk_insert_chunks, bulk_insert_dataframe
+from app.services.excel_importer import open_excel_file
+from app.services.file_validation_service import EXCEL_EXTENSIONS
 
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+    PYARROW_AVAILABLE = True
+    # Errors of Arrow's CSV reader that the pandas reader may still get past
+    ARROW_PARSE_ERRORS = (pyarrow.ArrowInvalid,)
+except ImportError:
+    PYARROW_AVAILABLE = False
+    ARROW_PARSE_ERRORS = ()
 
+logger = logging.getLogger(__name__)
 
 
 
 
+
+
+# Column definitions, quoted name and type, in CREATE TABLE SQL
+_COL_DEF_RE = re.compile(r'"([^"]+)"\s+(\w+(?:\s+\w+)*)')
+
+# Converted rows are only inserted, so floats are not downcast; DATE columns
+# from a user's CREATE TABLE are loaded as plain dates
+IMPORT_SQL_TYPE_CONVERTERS = {
+    **INSERT_SQL_TYPE_CONVERTERS,
+    "DATE": convert_date_column,
+}
+
+# CSV uploads are read as text so every chunk parses alike, whatever values
+# it happens to hold; the SQL types then decide each column's conversion.
+# Arrow-backed strings take about half the memory of Python string objects.
+CSV_READ_DTYPE = 'string[pyarrow_numpy]' if PYARROW_AVAILABLE else str
+
+# Bytes parsed per Arrow CSV block; each block becomes one chunk of rows
+CSV_ARROW_BLOCK_SIZE = 16 << 20
+
+# Field values read as missing, the same defaults pd.read_csv uses
+CSV_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+]
+
+
+@lru_cache(maxsize=128)
+def _parse_column_definitions(create_table_sql: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Name and upper-cased SQL type of each column in CREATE TABLE SQL, in order.
+    Memoized, since the column names and the type map of the same statement
+    are each needed while importing it
+    """
+    return tuple((col_name, col_type.upper()) for col_name, col_type in _COL_DEF_RE.findall(create_table_sql))
+
+
 def parse_column_mapping_from_sql(create_table_sql: str, original_columns: List[str]) -> Dict[str, str]:
     """
     Parse CREATE TABLE SQL to extract column mappings
     Returns mapping from original column names to SQL column names
     """
-    column_pattern = r'"([^"]+)"\s+\w+'
-    sql_columns = re.findall(column_pattern, create_table_sql)
-    
-    # Build mapping from original to SQL columns
-    mapping = {}
-    for i, original_col in enumerate(original_columns):
-        if i < len(sql_columns):
-            mapping[original_col] = sql_columns[i]
+    sql_columns = [col_name for col_name, _ in _parse_column_definitions(create_table_sql)]
     
-    return mapping
+    # Build mapping from original to SQL columns, pairing them by position
+    return dict(zip(original_columns, sql_columns))
 
 
 def apply_column_mapping(df: pd.DataFrame, column_mapping: Dict[str, str]) -> pd.DataFrame:
     """
     Apply column mapping to DataFrame and filter to only mapped columns
     """
-    # Rename columns according to mapping
-    df_mapped = df.rename(columns=column_mapping)
+    # Rename columns according to mapping; the renamed frame shares the
+    # input's data, since only the selection below is returned
+    df_mapped = df.rename(columns=column_mapping, copy=False)
     
     # Only keep columns that were successfully mapped
-    mapped_columns = [col for col in df_mapped.columns if col in column_mapping.values()]
+    target_columns = set(column_mapping.values())
+    mapped_columns = [col for col in df_mapped.columns if col in target_columns]
     return df_mapped[mapped_columns]
 
 
-def convert_data_for_sql_types(df: pd.DataFrame, sql_columns: List[str], create_table_sql: str) -> pd.DataFrame:
+def parse_column_types_from_sql(create_table_sql: str) -> Dict[str, str]:
     """
-    Convert DataFrame data to match the SQL column types defined in CREATE TABLE
+    Parse CREATE TABLE SQL to extract the upper-cased SQL type of each column
     """
-    df_converted = df.copy()
-    
-    # Extract column definitions from SQL
-    column_definitions = re.findall(r'"([^"]+)"\s+(\w+(?:\s+\w+)*)', create_table_sql)
-    column_type_map = {col_name: col_type.upper() for col_name, col_type in column_definitions}
+    return dict(_parse_column_definitions(create_table_sql))
+
+
+def convert_data_for_sql_types(df: pd.DataFrame, column_type_map: Dict[str, str]) -> pd.DataFrame:
+    """
+    Convert DataFrame data to match the SQL column types defined in CREATE TABLE,
+    as returned by parse_column_types_from_sql
+    """
+    converted_columns = {}
     
-    for col in df_converted.columns:
+    for col in df.columns:
         if col not in column_type_map:
             continue
             
-        sql_type = column_type_map[col]
-        series = df_converted[col]
-        
-        # Convert data based on the SQL column type from CREATE TABLE
-        if sql_type in ["SMALLINT", "INT2"]:
-            df_converted[col] = pd.to_numeric(series, errors='coerce').astype('Int16')
-        elif sql_type in ["INTEGER", "INT", "INT4"]:
-            df_converted[col] = pd.to_numeric(series, errors='coerce').astype('Int32')
-        elif sql_type in ["BIGINT", "INT8"]:
-            df_converted[col] = pd.to_numeric(series, errors='coerce').astype('Int64')
-        elif sql_type in ["DOUBLE PRECISION", "FLOAT8", "REAL", "FLOAT4"]:
-            df_converted[col] = pd.to_numeric(series, errors='coerce')
-        elif sql_type == "NUMERIC":
-            # Keep as string for NUMERIC type to preserve precision
-            df_converted[col] = series.astype(str)
-        elif sql_type == "BOOLEAN":
-            # Convert various boolean representations
-            bool_map = {
-                'true': True, 'false': False,
-                'True': True, 'False': False,
-                'TRUE': True, 'FALSE': False,
-                '1': True, '0': False,
-                1: True, 0: False,
-                True: True, False: False
-            }
-            df_converted[col] = series.map(bool_map).fillna(False)
-        elif sql_type in ["DATE"]:
-            # Convert to date
-            df_converted[col] = pd.to_datetime(series, errors='coerce').dt.date
-        elif sql_type in ["TIMESTAMP", "DATETIME"]:
-            df_converted[col] = pd.to_datetime(series, errors='coerce')
-        elif sql_type == "BIGINT" and col.lower().find('date') != -1:
-            # Handle BIGINT columns that store dates - convert to Unix timestamp
-            datetime_series = pd.to_datetime(series, errors='coerce')
-            df_converted[col] = (datetime_series - pd.Timestamp('1970-01-01')).dt.total_seconds().astype('Int64')
-        # For VARCHAR and TEXT, keep as object (string)
+        # Convert data based on the SQL column type from CREATE TABLE;
+        # VARCHAR and TEXT are kept as object (string)
+        converter = IMPORT_SQL_TYPE_CONVERTERS.get(column_type_map[col])
+        if converter is not None:
+            converted_columns[col] = converter(df[col])
+    
+    # Shallow copy: unconverted columns share their data with the input frame,
+    # and assigning a converted column replaces it without writing into df
+    df_converted = df.copy(deep=False)
+    for col, converted in converted_columns.items():
+        df_converted[col] = converted
     
     return df_converted
 
 
+def _mapped_column_pairs(columns: pd.Index, column_mapping: Dict[str, str]) -> Dict[str, str]:
+    """
+    Source column for each SQL column kept by apply_column_mapping, in the
+    order of the DataFrame's columns
+    """
+    target_columns = set(column_mapping.values())
+    pairs = {}
+    for col in columns:
+        target = column_mapping.get(col, col)
+        if target in target_columns:
+            pairs[target] = col
+    return pairs
+
+
+def _map_and_convert(
+    df: pd.DataFrame,
+    column_pairs: Dict[str, str],
+    column_type_map: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Rename, filter and convert columns in a single pass; equivalent to
+    convert_data_for_sql_types(apply_column_mapping(df, column_mapping), column_type_map)
+    without building the intermediate frames
+    """
+    mapped_columns = {}
+    for target, col in column_pairs.items():
+        converter = IMPORT_SQL_TYPE_CONVERTERS.get(column_type_map.get(target))
+        mapped_columns[target] = converter(df[col]) if converter is not None else df[col]
+    
+    return pd.DataFrame(mapped_columns, index=df.index, copy=False)
+
+
+def _read_csv_chunks(
+    file: BinaryIO,
+    columns: pd.Index,
+    convert: Callable[[pd.DataFrame], pd.DataFrame],
+    use_arrow: bool = PYARROW_AVAILABLE
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse a CSV file from its start in chunks, converting each. Arrow's
+    multithreaded reader is used when available; chunks keep the column
+    labels pd.read_csv gave the header
+    """
+    file.seek(0)
+    if not use_arrow:
+        with pd.read_csv(file, dtype=CSV_READ_DTYPE, chunksize=COPY_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                yield convert(chunk)
+        return
+    
+    # The header is read as the first data row, which lets the parser handle
+    # quoting in it, and every column is typed by its generated name as text
+    reader = pyarrow_csv.open_csv(
+        file,
+        read_options=pyarrow_csv.ReadOptions(
+            autogenerate_column_names=True, block_size=CSV_ARROW_BLOCK_SIZE
+        ),
+        convert_options=pyarrow_csv.ConvertOptions(
+            column_types={f'f{i}': pyarrow.string() for i in range(len(columns))},
+            null_values=CSV_NULL_VALUES,
+            strings_can_be_null=True
+        )
+    )
+    string_dtype = pd.StringDtype('pyarrow_numpy')
+    is_header = True
+    for batch in reader:
+        chunk = batch.to_pandas(types_mapper=lambda arrow_type: string_dtype)
+        if is_header:
+            chunk = chunk.iloc[1:]
+            is_header = False
+        chunk.columns = columns
+        yield convert(chunk)
+
+
 async def import_file_with_sql(
     db: Session,
     file: UploadFile,
     create_table_sql: str,
     table_name: str,
     column_mapping_json: Optional[str] = None,
-    sheet_name: Optional[str] = None
+    sheet_name: Optional[str] = None,
+    column_mapping: Optional[Dict[str, str]] = None
 ) -> Dict:
     """
-    Unified import function for both CSV and Excel files with custom SQL
+    Unified import function for both CSV and Excel files with custom SQL.
+    A column_mapping dict takes precedence over column_mapping_json, which
+    is kept for callers that still pass the raw JSON string.
     """
     try:
         # Validate and execute the CREATE TABLE SQL
@@ -113,63 +218,80 @@ async def import_file_with_sql(
         if not sql_upper.startswith('CREATE TABLE'):
             raise ValueError("SQL must be a CREATE TABLE statement")
         
+        # Decode the mapping before creating the table so malformed JSON
+        # fails the request without leaving an empty table behind
+        if column_mapping is None and column_mapping_json:
+            column_mapping = json.loads(column_mapping_json)
+        
         # Execute the CREATE TABLE statement
         db.execute(text(create_table_sql))
         db.commit()
         
-        # Read file based on type
-        content = await file.read()
-        if file.filename and (file.filename.endswith('.xlsx') or file.filename.endswith('.xls')):
-            # Excel file
-            if sheet_name:
-                df = pd.read_excel(io.BytesIO(content), sheet_name=sheet_name)
-            else:
-                df = pd.read_excel(io.BytesIO(content))
+        # Read file based on type. With pyarrow, text columns are stored as
+        # Arrow-backed strings (missing values stay NaN); columns are only
+        # mapped and converted to the given SQL types, so no type detection sees them
+        is_excel = bool(file.filename) and file.filename.lower().endswith(EXCEL_EXTENSIONS)
+        if is_excel:
+            with pd.option_context('future.infer_string', PYARROW_AVAILABLE):
+                with open_excel_file(file.file) as excel_file:
+                    df = excel_file.parse(sheet_name=sheet_name or 0)
+            source_columns = df.columns
         else:
-            # CSV file
-            df = pd.read_csv(io.BytesIO(content))
+            # CSV rows are streamed in chunks during the import; only the
+            # header is read here
+            file.file.seek(0)
+            source_columns = pd.read_csv(file.file, nrows=0).columns
         
         # Parse SQL to get column information
-        column_pattern = r'"([^"]+)"\s+\w+'
-        sql_columns = re.findall(column_pattern, create_table_sql)
+        sql_columns = [col_name for col_name, _ in _parse_column_definitions(create_table_sql)]
+        column_type_map = parse_column_types_from_sql(create_table_sql)
         
         # Apply column mapping
-        if column_mapping_json:
-            column_mapping = json.loads(column_mapping_json)
-        else:
-            # Auto-generate mapping based on column sanitization
+        if column_mapping is None:
+            # Auto-generate mapping based on column sanitization; membership
+            # is tested against a set so wide files map in linear time
             column_mapping = {}
-            for i, original_col in enumerate(df.columns):
+            sql_column_set = set(sql_columns)
+            id_renamed = 'id_original' in sql_column_set and 'id' not in sql_column_set
+            for i, original_col in enumerate(source_columns):
                 sanitized = sanitize_column_name(str(original_col))
                 
                 # Handle special case where id column was renamed to id_original
-                if sanitized == 'id' and 'id_original' in sql_columns and 'id' not in sql_columns:
+                if id_renamed and sanitized == 'id':
                     column_mapping[original_col] = 'id_original'
                 elif i < len(sql_columns):
                     column_mapping[original_col] = sql_columns[i]
-                elif sanitized in sql_columns:
+                elif sanitized in sql_column_set:
                     column_mapping[original_col] = sanitized
         
-        # Apply column mapping and filter
-        df_mapped = apply_column_mapping(df, column_mapping)
-        
-        # Convert data types to match SQL schema
-        df_converted = convert_data_for_sql_types(df_mapped, sql_columns, create_table_sql)
-        
-        # Import data to the table
-        df_converted.to_sql(
-            table_name,
-            con=db.get_bind(),
-            if_exists='append',
-            index=False,
-            method='multi'
-        )
+        # Import data to the table; each chunk is mapped to the SQL columns and
+        # converted to their data types in one pass as the chunks are written
+        column_pairs = _mapped_column_pairs(source_columns, column_mapping)
+        convert = partial(_map_and_convert, column_pairs=column_pairs, column_type_map=column_type_map)
+        if is_excel:
+            bulk_insert_dataframe(db.get_bind(), table_name, df, convert=convert)
+            row_count = len(df)
+        else:
+            # Peak memory is bounded by one chunk rather than the whole file
+            try:
+                row_count = bulk_insert_chunks(
+                    db.get_bind(), table_name,
+                    lambda: _read_csv_chunks(file.file, source_columns, convert)
+                )
+            except ARROW_PARSE_ERRORS as e:
+                # Arrow is stricter than pandas (e.g. about rows with missing
+                # fields); nothing was committed, so parse again with pandas
+                logger.warning(f"Arrow could not parse {file.filename}, reading it with pandas: {e}")
+                row_count = bulk_insert_chunks(
+                    db.get_bind(), table_name,
+                    lambda: _read_csv_chunks(file.file, source_columns, convert, use_arrow=False)
+                )
         
         return {
-            "message": f"Successfully imported {len(df_converted)} rows to table '{table_name}'",
+            "message": f"Successfully imported {row_count} rows to table '{table_name}'",
             "table_name": table_name,
-            "row_count": len(df_converted),
-            "column_count": len(df_converted.columns)
+            "row_count": row_count,
+            "column_count": len(column_pairs)
         }
         
     except Exception as e:
@@ -2,6 +2,7 @@
 Shared utilities for CSV and Excel import operations.
 This ensures consistency between preview and actual import.
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, date
@@ -11,7 +12,8 @@ from app.services.csv_importer import generate_create_table_sql
 def prepare_dataframe_for_import(
     df: pd.DataFrame, 
     table_name: str,
-    column_types: Optional[Dict[str, str]] = None
+    column_types: Optional[Dict[str, str]] = None,
+    detect_types: bool = True
 ) -> Tuple[str, List[str], Dict[str, str], bool]:
     """
     Prepare a DataFrame for import by generating CREATE TABLE SQL and column mappings.
@@ -20,6 +22,9 @@ def prepare_dataframe_for_import(
         df: The DataFrame to import
         table_name: Target table name
         column_types: Optional dictionary of column names to SQL types
+        detect_types: Whether to detect the types of columns missing from
+            column_types; pass False when only the insert columns and column
+            mapping are needed, as the types only shape the CREATE TABLE SQL
         
     Returns:
         Tuple of:
@@ -28,12 +33,11 @@ def prepare_dataframe_for_import(
         - column_mapping: Mapping of original to SQL column names
         - has_auto_generated_id: Whether an auto-generated ID was added
     """
-    if column_types is None:
-        from app.services.type_detection import detect_column_type
+    if column_types is None and not detect_types:
         column_types = {}
-        for col in df.columns:
-            sql_type, _ = detect_column_type(df[col])
-            column_types[col] = sql_type
+    elif column_types is None:
+        from app.services.type_detection import detect_column_types
+        column_types = {col: sql_type for col, (sql_type, _) in detect_column_types(df).items()}
     
     # Generate CREATE TABLE SQL and get column mapping
     create_table_sql, has_valid_id, column_mapping = generate_create_table_sql(
@@ -91,6 +95,70 @@ def format_value_for_sql(val: Any) -> str:
         return str(val)
 
 
+def format_column_for_sql(series: pd.Series) -> np.ndarray:
+    """
+    Format all values of a column for SQL INSERT statements at once.
+    
+    Args:
+        series: The column to format
+        
+    Returns:
+        Array with the format_value_for_sql literal of each value
+    """
+    # Plain numpy columns are formatted in one vectorized pass
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+        return _format_numbers_for_sql(series.to_numpy())
+    
+    # So are nullable and Arrow-backed numeric columns, through their numpy
+    # values with the missing entries written as NULL
+    if (
+        pd.api.types.is_extension_array_dtype(series.dtype)
+        and not isinstance(series.dtype, pd.SparseDtype)
+        and series.dtype.kind in 'biuf'
+    ):
+        missing = series.isna().to_numpy()
+        fill_value = {'b': False, 'f': np.nan}.get(series.dtype.kind, 0)
+        formatted = _format_numbers_for_sql(
+            series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=fill_value)
+        ).astype(object)
+        formatted[missing] = "NULL"
+        return formatted
+    
+    objects = series.array.astype(object)
+    
+    # Text columns skip the per-value type dispatch of format_value_for_sql
+    if pd.api.types.infer_dtype(objects, skipna=True) == 'string':
+        return _format_text_for_sql(objects)
+    
+    # Dates, mixed values and other extension types go value by value
+    return np.array([format_value_for_sql(val) for val in objects], dtype=object)
+
+
+def _format_numbers_for_sql(values: np.ndarray) -> np.ndarray:
+    """format_value_for_sql of each value in a numpy bool, integer or float array"""
+    if values.dtype.kind == 'b':
+        return np.where(values, 'TRUE', 'FALSE')
+    if values.dtype.kind in 'iu':
+        return values.astype(str)
+    # Cast to float64 first so float32 values print like Python floats
+    formatted = values.astype(np.float64).astype(str).astype(object)
+    formatted[np.isnan(values)] = "NULL"
+    return formatted
+
+
+def _format_text_for_sql(values: np.ndarray) -> np.ndarray:
+    """format_value_for_sql of each value in an object array of strings and nulls"""
+    formatted = np.full(len(values), "NULL", dtype=object)
+    present = ~pd.isna(values)
+    formatted[present] = [
+        # Integer strings stay unquoted numeric literals
+        val if val.isdigit() or (val[:1] == '-' and val[1:].isdigit())
+        else "'" + val.replace("'", "''") + "'"
+        for val in values[present]
+    ]
+    return formatted
+
+
 def generate_insert_sql(
     df: pd.DataFrame,
     table_name: str,
@@ -110,17 +178,21 @@ def generate_insert_sql(
         List of INSERT SQL statements
     """
     insert_statements = []
+    insert_prefix = f"INSERT INTO {table_name} ({', '.join(insert_columns)}) VALUES "
+    
+    # Format column by column, then join the literals of each row
+    formatted_columns = [format_column_for_sql(df.iloc[:, i]) for i in range(len(df.columns))]
     
     for i in range(0, len(df), batch_size):
-        batch = df.iloc[i:i+batch_size]
+        # Rows are joined one batch at a time, so a string per row of the
+        # whole frame is never held alongside the statements
+        if formatted_columns:
+            batch_rows = zip(*(values[i:i+batch_size] for values in formatted_columns))
+            values_list = [f"({', '.join(values)})" for values in batch_rows]
+        else:
+            values_list = ["()"] * len(df.index[i:i+batch_size])
         
         # Generate INSERT statements
-        values_list = []
-        for _, row in batch.iterrows():
-            values = [format_value_for_sql(val) for val in row.values]
-            values_list.append(f"({', '.join(values)})")
-        
-        insert_sql = f"INSERT INTO {table_name} ({', '.join(insert_columns)}) VALUES {', '.join(values_list)}"
-        insert_statements.append(insert_sql)
+        insert_statements.append(insert_prefix + ', '.join(values_list))
     
     return insert_statements
\ No newline at end of file
@@ -39,7 +39,9 @@ class TransformationEngine:
     async def apply_transformations(self, df: pd.DataFrame, steps: List[TransformationStep], 
                                    transaction_context: Optional['TransactionContext'] = None) -> pd.DataFrame:
         """Apply a series of transformation steps to a DataFrame"""
-        result_df = df.copy()
+        # Shallow copies throughout: steps only ever replace whole columns or
+        # return new frames, so the input's data is shared and never written to
+        result_df = df.copy(deep=False)
         
         for i, step in enumerate(steps):
             if step.type not in self.supported_transformations:
@@ -103,7 +105,7 @@ class TransformationEngine:
     async def _apply_filter(self, df: pd.DataFrame, config: Dict[str, Any], 
                            transaction_context: Optional['TransactionContext'] = None) -> pd.DataFrame:
         """Apply filtering rules to DataFrame"""
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         
         # Parse filter rules
         if 'rules' in config:
@@ -163,7 +165,7 @@ class TransformationEngine:
     
     async def _apply_cleaning(self, df: pd.DataFrame, config: Dict[str, Any], transaction_context: Optional["TransactionContext"] = None) -> pd.DataFrame:
         """Apply cleaning rules to DataFrame"""
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         
         # Parse cleaning rules
         if 'rules' in config:
@@ -276,7 +278,7 @@ class TransformationEngine:
     async def _apply_column_split(self, df: pd.DataFrame, config: Dict[str, Any], transaction_context: Optional["TransactionContext"] = None) -> pd.DataFrame:
         """Split a column into multiple columns"""
         split_config = ColumnSplitConfig(**config)
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         
         if split_config.column not in result_df.columns:
             raise ValueError(f"Column '{split_config.column}' not found in data")
@@ -311,7 +313,7 @@ class TransformationEngine:
     async def _apply_column_merge(self, df: pd.DataFrame, config: Dict[str, Any], transaction_context: Optional["TransactionContext"] = None) -> pd.DataFrame:
         """Merge multiple columns into one"""
         merge_config = ColumnMergeConfig(**config)
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         
         # Validate columns
         for col in merge_config.columns:
@@ -332,7 +334,7 @@ class TransformationEngine:
     async def _apply_type_conversion(self, df: pd.DataFrame, config: Dict[str, Any], transaction_context: Optional["TransactionContext"] = None) -> pd.DataFrame:
         """Convert column data types"""
         conv_config = TypeConversionConfig(**config)
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         
         if conv_config.column not in result_df.columns:
             raise ValueError(f"Column '{conv_config.column}' not found in data")
@@ -391,7 +393,7 @@ class TransformationEngine:
     
     async def _apply_rename(self, df: pd.DataFrame, config: Dict[str, Any], transaction_context: Optional["TransactionContext"] = None) -> pd.DataFrame:
         """Rename columns"""
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         rename_map = config.get('rename_map', {})
         
         # Validate columns
@@ -404,7 +406,7 @@ class TransformationEngine:
     
     async def _apply_drop(self, df: pd.DataFrame, config: Dict[str, Any], transaction_context: Optional["TransactionContext"] = None) -> pd.DataFrame:
         """Drop columns"""
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         columns_to_drop = config.get('columns', [])
         
         # Validate columns
@@ -417,7 +419,7 @@ class TransformationEngine:
     
     async def _apply_fill_null(self, df: pd.DataFrame, config: Dict[str, Any], transaction_context: Optional["TransactionContext"] = None) -> pd.DataFrame:
         """Fill null values"""
-        result_df = df.copy()
+        result_df = df.copy(deep=False)
         
         if 'column' in config:
             # Fill specific column
@@ -588,7 +590,7 @@ class TransformationEngine:
     async def save_to_table(self, df: pd.DataFrame, table_name: str, executor, if_exists: str = 'replace', primary_key_columns: Optional[List[str]] = None):
         """Save DataFrame to database table with various modes"""
         from app.services.import_utils import prepare_dataframe_for_import
-        from app.services.type_detection import detect_column_type
+        from app.services.type_detection import detect_column_types
         
         # Check if table exists
         table_exists = await self._check_table_exists(executor, table_name)
@@ -602,13 +604,10 @@ class TransformationEngine:
         elif if_exists == 'fail' and table_exists:
             raise Exception(f"Table '{table_name}' already exists and if_exists='fail'")
         
-        # Detect column types
-        column_types = {}
-        for col in df.columns:
-            sql_type, _ = detect_column_type(df[col])
-            column_types[col] = sql_type
-        
         if not table_exists:
+            # Detect column types for the new table
+            column_types = {col: sql_type for col, (sql_type, _) in detect_column_types(df).items()}
+            
             # Create table if it doesn't exist
             create_table_sql, insert_columns, _, _ = prepare_dataframe_for_import(
                 df, table_name, column_types
@@ -1,5 +1,76 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple
+
 import pandas as pd
-from typing import Tuple
+
+
+# Values a column may hold to be detected as BOOLEAN
+BOOLEAN_VALUES = frozenset({True, False, 1, 0, "true", "false", "True", "False", "TRUE", "FALSE"})
+
+# Leading values checked before collecting every distinct value of a column
+BOOLEAN_PREFIX_ROWS = 100
+
+# Leading values parsed before a whole column is tried as datetimes
+DATETIME_PREFIX_ROWS = 100
+
+# Leading values parsed before a whole column is tried as numbers
+NUMERIC_PREFIX_ROWS = 100
+
+# Columns a DataFrame needs before detect_column_types uses a thread pool
+PARALLEL_DETECTION_MIN_COLUMNS = 8
+
+
+def _is_boolean_like(non_null: pd.Series) -> bool:
+    """Check whether every value of a null-free Series is a boolean spelling"""
+    # Most columns fail on their first values, which spares the full pass.
+    # isin probes a hashtable of the tokens, so no array of the column's
+    # distinct values is built either
+    if not non_null.head(BOOLEAN_PREFIX_ROWS).isin(BOOLEAN_VALUES).all():
+        return False
+    return bool(non_null.isin(BOOLEAN_VALUES).all())
+
+
+def _has_time_component(datetime_series: pd.Series) -> bool:
+    """Check whether any value is not at midnight; NaT counts as having a time"""
+    return bool((datetime_series != datetime_series.dt.normalize()).any())
+
+
+def _max_text_length(non_null: pd.Series) -> int:
+    """Length of the longest value of a null-free Series in its string form"""
+    if isinstance(non_null.dtype, pd.StringDtype):
+        # Arrow and pandas strings are measured in one vectorized pass
+        return int(non_null.str.len().max())
+    # Columns of Python strings are measured directly, without building
+    # the string copy of the column astype(str) makes for mixed values
+    values = non_null.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=False) == 'string':
+        return max(map(len, values))
+    return int(non_null.astype(str).str.len().max())
+
+
+def _integer_sql_type(min_val, max_val) -> Tuple[str, str]:
+    """Pick the smallest integer SQL type holding values between min_val and max_val"""
+    # Check if values exceed BIGINT range
+    if max_val > 9223372036854775807 or min_val < -9223372036854775808:
+        # Use NUMERIC for values that exceed BIGINT
+        return "NUMERIC", "object"
+    elif min_val >= -32768 and max_val <= 32767:
+        return "SMALLINT", "int16"
+    elif min_val >= -2147483648 and max_val <= 2147483647:
+        return "INTEGER", "int32"
+    else:
+        return "BIGINT", "int64"
+
+
+def _numeric_sql_type(numeric_series: pd.Series) -> Tuple[str, str]:
+    """Detect the SQL type of a null-free numeric Series"""
+    if (numeric_series % 1 == 0).all():
+        # Integer type
+        return _integer_sql_type(numeric_series.min(), numeric_series.max())
+    else:
+        # Float type
+        return "DOUBLE PRECISION", "float64"
 
 
 def detect_column_type(series: pd.Series) -> Tuple[str, str]:
@@ -15,14 +86,30 @@ def detect_column_type(series: pd.Series) -> Tuple[str, str]:
     if len(non_null) == 0:
         return "TEXT", "object"
     
+    # Columns read_csv/read_excel already typed need no re-parsing
+    if pd.api.types.is_bool_dtype(series):
+        return "BOOLEAN", "bool"
+    
+    if pd.api.types.is_integer_dtype(series):
+        min_val, max_val = non_null.min(), non_null.max()
+        # Only 0/1 columns are boolean spellings
+        if min_val >= 0 and max_val <= 1:
+            return "BOOLEAN", "bool"
+        return _integer_sql_type(min_val, max_val)
+    
+    if pd.api.types.is_float_dtype(series):
+        if _is_boolean_like(non_null):
+            return "BOOLEAN", "bool"
+        return _numeric_sql_type(non_null)
+    
     # Check for boolean
-    if set(non_null.unique()).issubset({True, False, 1, 0, "true", "false", "True", "False", "TRUE", "FALSE"}):
+    if _is_boolean_like(non_null):
         return "BOOLEAN", "bool"
     
     # Check if the series already contains datetime objects (from Excel/other sources)
     if pd.api.types.is_datetime64_any_dtype(series):
         # Check if it has time component
-        if (series.dt.time != pd.Timestamp('00:00:00').time()).any():
+        if _has_time_component(series):
             return "TIMESTAMP", "datetime64[ns]"
         else:
             return "DATE", "datetime64[ns]"
@@ -35,8 +122,13 @@ def detect_column_type(series: pd.Series) -> Tuple[str, str]:
             date_formats = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d', 
                            '%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M:%S', '%m/%d/%Y %H:%M:%S']
             
+            # Every value must parse, so a format the leading values reject is
+            # skipped without parsing (and hashing) the whole column
+            head = non_null.head(DATETIME_PREFIX_ROWS)
+            
             for fmt in date_formats:
                 try:
+                    pd.to_datetime(head, format=fmt, errors='raise')
                     pd.to_datetime(non_null, format=fmt, errors='raise')
                     if '%H:%M:%S' in fmt:
                         return "TIMESTAMP", "datetime64[ns]"
@@ -48,42 +140,48 @@ def detect_column_type(series: pd.Series) -> Tuple[str, str]:
             # Try pandas auto-detection for strings that look like dates
             # Only if all values are strings and look date-like
             if all(isinstance(val, str) for val in non_null.head(5)):
+                pd.to_datetime(head, errors='raise')
                 datetime_series = pd.to_datetime(non_null, errors='raise')
                 # Check if it has time component
-                if (datetime_series.dt.time != pd.Timestamp('00:00:00').time()).any():
+                if _has_time_component(datetime_series):
                     return "TIMESTAMP", "datetime64[ns]"
                 else:
                     return "DATE", "datetime64[ns]"
         except (ValueError, TypeError):
             pass
     
-    # Try to convert to numeric (after datetime check)
+    # Try to convert to numeric (after datetime check). Text columns fail on
+    # their leading values, which spares converting the whole column; string
+    # dtypes are copied to objects in full before to_numeric parses anything
     try:
+        pd.to_numeric(non_null.head(NUMERIC_PREFIX_ROWS), errors='raise')
         numeric_series = pd.to_numeric(non_null, errors='raise')
-        if (numeric_series % 1 == 0).all():
-            # Integer type
-            max_val = numeric_series.max()
-            min_val = numeric_series.min()
-            
-            # Check if values exceed BIGINT range
-            if max_val > 9223372036854775807 or min_val < -9223372036854775808:
-                # Use NUMERIC for values that exceed BIGINT
-                return "NUMERIC", "object"
-            elif min_val >= -32768 and max_val <= 32767:
-                return "SMALLINT", "int16"
-            elif min_val >= -2147483648 and max_val <= 2147483647:
-                return "INTEGER", "int32"
-            else:
-                return "BIGINT", "int64"
-        else:
-            # Float type
-            return "DOUBLE PRECISION", "float64"
+        return _numeric_sql_type(numeric_series)
     except (ValueError, TypeError, OverflowError):
         pass
     
-    # Check string length for VARCHAR vs TEXT
-    max_length = non_null.astype(str).str.len().max()
+    # Check string length for VARCHAR vs TEXT. Every value is measured, as a
+    # sample could size a VARCHAR too small for the rows it missed
+    max_length = _max_text_length(non_null)
     if max_length <= 255:
         return f"VARCHAR({min(max_length * 2, 255)})", "object"
     else:
-        return "TEXT", "object"
\ No newline at end of file
+        return "TEXT", "object"
+
+
+def detect_column_types(df: pd.DataFrame) -> Dict[Any, Tuple[str, str]]:
+    """
+    Detect the SQL data type of every column of a DataFrame.
+    Returns a dict of column name -> (sql_type, pandas_dtype)
+    
+    Columns are independent, so wide frames are detected in a thread pool;
+    pandas releases the GIL for much of the hashing and parsing involved.
+    """
+    columns = list(df.columns)
+    workers = min(len(columns), os.cpu_count() or 1)
+    
+    if len(columns) < PARALLEL_DETECTION_MIN_COLUMNS or workers < 2:
+        return {col: detect_column_type(df[col]) for col in columns}
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(columns, executor.map(lambda col: detect_column_type(df[col]), columns)))
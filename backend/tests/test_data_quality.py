@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from app.services.data_quality_manager import RangeRule, UniqueRule
+
+
+def test_range_rule_all_null_nullable_column():
+    df = pd.DataFrame({"amount": pd.Series([None, None], dtype="Int64")})
+    rule = RangeRule({"amount": (0, 10)})
+    assert rule.validate(df) == []
+
+
+def test_range_rule_reports_out_of_range_values():
+    df = pd.DataFrame({"amount": pd.Series([1, None, 42], dtype="Int64")})
+    rule = RangeRule({"amount": (0, 10)})
+    issues = rule.validate(df)
+    assert [(issue.row_index, issue.value) for issue in issues] == [(2, 42)]
+
+
+def test_unique_rule_matches_duplicated_for_nulls():
+    rule = UniqueRule(["code"])
+    for values in (["a", "b", "a", None, np.nan], ["a", "b", None, np.nan], ["a", None, None]):
+        df = pd.DataFrame({"code": pd.Series(values, dtype=object)})
+        expected = df.index[df["code"].duplicated(keep=False)].tolist()
+        assert [issue.row_index for issue in rule.validate(df)] == expected
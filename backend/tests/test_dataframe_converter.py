@@ -0,0 +1,16 @@
+import pandas as pd
+
+from app.services.dataframe_converter import convert_dataframe_types_from_detection
+
+
+def test_compact_timestamp_strings_are_not_read_as_epochs():
+    df = pd.DataFrame({"seconds": ["20240115123000"], "minutes": ["202401151230"]})
+    converted = convert_dataframe_types_from_detection(df, {"seconds": "TIMESTAMP", "minutes": "TIMESTAMP"})
+    assert converted["seconds"][0] == pd.Timestamp("2024-01-15 12:30:00")
+    assert converted["minutes"][0] == pd.Timestamp("2024-01-15 12:30:00")
+
+
+def test_integer_epoch_columns_are_read_in_seconds():
+    df = pd.DataFrame({"created": [1705321800]})
+    converted = convert_dataframe_types_from_detection(df, {"created": "TIMESTAMP"})
+    assert converted["created"][0] == pd.Timestamp("2024-01-15 12:30:00")
@@ -0,0 +1,34 @@
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from app.services.data_extraction.relational_connector import RelationalDatabaseConnector
+
+
+async def _extract_all(connector, source, extraction_config):
+    try:
+        return [chunk async for chunk in connector.extract_data(source, extraction_config)]
+    finally:
+        await connector.disconnect()
+
+
+def test_partitioned_extract_keeps_rows_on_text_datetime_bounds(tmp_path):
+    database = tmp_path / "events.db"
+    start = datetime(2024, 1, 1)
+    with sqlite3.connect(database) as conn:
+        conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, created_at DATETIME)")
+        # SQLite keeps DATETIME values as text, here without fractional seconds
+        conn.executemany(
+            "INSERT INTO events (id, created_at) VALUES (?, ?)",
+            [(i, (start + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S")) for i in range(61)]
+        )
+    
+    connector = RelationalDatabaseConnector({"type": "sqlite", "database": str(database)})
+    chunks = asyncio.run(_extract_all(
+        connector, "events", {"incremental_column": "created_at", "parallelism": 4}
+    ))
+    
+    extracted = pd.concat(chunks)
+    assert sorted(extracted["id"]) == list(range(61))
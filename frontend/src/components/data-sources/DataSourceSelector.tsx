@@ -162,7 +162,8 @@ const DataSourceSelector: React.FC<Props> = ({ open, onClose, onDataSourceCreate
     try {
       const request: ConnectionTestRequest = {
         type: selectedSource.type,
-        connection_config: connectionConfig
+        connection_config: connectionConfig,
+        include_stats: true
       };
       
       const response = await dataSourceAPI.testConnection(request);
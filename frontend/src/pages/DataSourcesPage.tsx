@@ -31,7 +31,8 @@ import {
   MenuItem,
   FormControlLabel,
   Switch,
-  Divider
+  Divider,
+  Collapse
 } from '@mui/material';
 import {
   Add as AddIcon,
@@ -39,7 +40,9 @@ import {
   Refresh as RefreshIcon,
   PlayArrow as ExtractIcon,
   Visibility as PreviewIcon,
-  Storage as DatabaseIcon
+  Storage as DatabaseIcon,
+  ExpandMore as ExpandMoreIcon,
+  ExpandLess as ExpandLessIcon
 } from '@mui/icons-material';
 import DataSourceSelector from '../components/data-sources/DataSourceSelector';
 import { dataSourceAPI, DataSource, SchemaInfo, DataPreview } from '../services/dataSourceAPI';
@@ -68,6 +71,8 @@ const DataSourcesPage: React.FC = () => {
   const [showSelector, setShowSelector] = useState(false);
   const [selectedDataSource, setSelectedDataSource] = useState<DataSource | null>(null);
   const [schemaInfo, setSchemaInfo] = useState<SchemaInfo[]>([]);
+  const [expandedTable, setExpandedTable] = useState<string>('');
+  const [tableColumns, setTableColumns] = useState<Record<string, SchemaInfo['columns']>>({});
   const [previewData, setPreviewData] = useState<DataPreview | null>(null);
   const [previewSource, setPreviewSource] = useState<string>('');
   const [tabValue, setTabValue] = useState(0);
@@ -130,8 +135,11 @@ const DataSourcesPage: React.FC = () => {
     try {
       setSelectedDataSource(dataSource);
       setTabValue(0);
+      setExpandedTable('');
+      setTableColumns({});
       
-      const response = await dataSourceAPI.getSchema({
+      // Only table names are listed up front; columns load when a table is expanded
+      const response = await dataSourceAPI.listTables({
         type: dataSource.type,
         connection_config: dataSource.connection_config
       });
@@ -141,6 +149,29 @@ const DataSourcesPage: React.FC = () => {
     }
   };
 
+  const handleToggleTable = async (tableName: string) => {
+    if (!selectedDataSource) return;
+
+    if (expandedTable === tableName) {
+      setExpandedTable('');
+      return;
+    }
+    setExpandedTable(tableName);
+    if (tableColumns[tableName]) return;
+
+    try {
+      const response = await dataSourceAPI.describeTable({
+        type: selectedDataSource.type,
+        connection_config: selectedDataSource.connection_config,
+        source_name: tableName
+      });
+      setTableColumns(prev => ({ ...prev, [tableName]: response.data.columns || [] }));
+    } catch (err: any) {
+      setError(`Failed to load columns for ${tableName}`);
+      setExpandedTable('');
+    }
+  };
+
   const handlePreviewData = async (sourceName: string) => {
     if (!selectedDataSource) return;
 
@@ -403,17 +434,44 @@ const DataSourcesPage: React.FC = () => {
                                 {item.name}
                               </Typography>
                               <Typography variant="caption" color="text.secondary">
-                                {item.type} • {item.row_count || item.document_count || 0} records
+                                {item.type}
+                                {(item.row_count ?? item.document_count) !== undefined &&
+                                  ` • ${item.row_count ?? item.document_count} records`}
                               </Typography>
                             </Box>
-                            <Button
-                              size="small"
-                              onClick={() => handlePreviewData(item.name)}
-                              startIcon={<PreviewIcon />}
-                            >
-                              Preview
-                            </Button>
+                            <Box>
+                              <IconButton
+                                size="small"
+                                onClick={() => handleToggleTable(item.name)}
+                                title={expandedTable === item.name ? 'Hide Columns' : 'Show Columns'}
+                              >
+                                {expandedTable === item.name ? <ExpandLessIcon /> : <ExpandMoreIcon />}
+                              </IconButton>
+                              <Button
+                                size="small"
+                                onClick={() => handlePreviewData(item.name)}
+                                startIcon={<PreviewIcon />}
+                              >
+                                Preview
+                              </Button>
+                            </Box>
                           </Box>
+                          <Collapse in={expandedTable === item.name} unmountOnExit>
+                            {tableColumns[item.name] ? (
+                              <Box sx={{ mt: 1, display: 'flex', flexWrap: 'wrap', gap: 0.5 }}>
+                                {tableColumns[item.name]!.map((col) => (
+                                  <Chip
+                                    key={col.name}
+                                    size="small"
+                                    variant="outlined"
+                                    label={`${col.name}: ${col.sql_type || col.type}`}
+                                  />
+                                ))}
+                              </Box>
+                            ) : (
+                              <CircularProgress size={20} sx={{ mt: 1 }} />
+                            )}
+                          </Collapse>
                         </CardContent>
                       </Card>
                     ))}
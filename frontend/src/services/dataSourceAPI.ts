@@ -57,6 +57,7 @@ export interface SupportedDataSource {
 export interface ConnectionTestRequest {
   type: string;
   connection_config: Record<string, any>;
+  include_stats?: boolean;
 }
 
 // This service provides helpful error messages when data source is not selected
@@ -169,7 +170,7 @@ export const dataSourceAPI = {
   deleteDataSource: (id: number) => api.delete(`/data-sources/${id}`),
   
   // Test connection to a data source
-  testConnection: (connectionData: { type: string; connection_config: Record<string, any> }) =>
+  testConnection: (connectionData: ConnectionTestRequest) =>
     api.post('/data-sources/test-connection', connectionData),
   
   // Get supported data source types
@@ -179,6 +180,14 @@ export const dataSourceAPI = {
   getSchema: (connectionData: { type: string; connection_config: Record<string, any> }) =>
     api.post('/data-sources/schema', connectionData),
   
+  // List tables without column metadata (columns are loaded per table via describeTable)
+  listTables: (connectionData: { type: string; connection_config: Record<string, any>; include_row_counts?: boolean }) =>
+    api.post('/data-sources/schema/tables', connectionData),
+  
+  // Get column metadata for a single table
+  describeTable: (connectionData: { type: string; connection_config: Record<string, any>; source_name: string }) =>
+    api.post('/data-sources/schema/describe', connectionData),
+  
   // Preview data from a data source
   previewData: (
     type: string, 